@@ -41,14 +41,12 @@ def get_current_user_id_from_cookie_websocket(
     Websocket dependency for getting logged user's id
     from `Authorization` cookie. Returns 403 if unauthenticated.
     """
-    try:
-        bearer, token = access_token.split()
-
-        if bearer.lower() != "bearer":
-            raise WebSocketBadTokenException
+    if access_token[:7] not in ("Bearer ", "bearer "):
+        raise WebSocketBadTokenException
 
+    try:
         return auth_service.get_user_id_from_token(
-            AuthTokenTypes.ACCESS, token
+            AuthTokenTypes.ACCESS, access_token[7:]
         )
     except JWTError as exc:
         raise WebSocketBadTokenException from exc
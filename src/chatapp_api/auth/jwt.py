@@ -1,59 +1,274 @@
-from datetime import datetime, timedelta
-from enum import Enum
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from functools import cache, partial
+from typing import Any
 
+import bcrypt
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt
-from passlib.context import CryptContext
+from jose import ExpiredSignatureError, JWTError
 
 from src.chatapp_api.config import (
     JWT_ACCESS_TOKEN_EXPIRE,
     JWT_ALGORITHM,
+    JWT_MAX_LENGTH,
     JWT_REFRESH_TOKEN_EXPIRE,
+    PASSWORD_VERIFY_CACHE_SIZE,
+    PASSWORD_VERIFY_CACHE_TTL,
+    Seconds,
     settings,
 )
+from src.chatapp_api.utils import TTLCache
 
-password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
+# bcrypt releases the GIL while hashing, so threads run it in parallel.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="bcrypt"
+)
+# Keys of recently verified (password, hash) pairs. Failed checks are
+# never kept, so every wrong attempt pays the full bcrypt cost.
+# Only hmac digests are kept, never plain passwords.
+_password_checks: TTLCache[bytes, bool] = TTLCache(
+    maxsize=PASSWORD_VERIFY_CACHE_SIZE, ttl=PASSWORD_VERIFY_CACHE_TTL
+)
+
+
+def _hash_password(password: str) -> str:
+    """Hashes given password with bcrypt."""
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+def _password_cache_key(password: str, hashed_password: str) -> bytes:
+    """Returns keyed digest identifying (password, hash) pair."""
+    return hmac.new(
+        settings.secret_key.encode(),
+        f"{password}:{hashed_password}".encode(),
+        hashlib.sha256,
+    ).digest()
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    """Checks whether given password matches bcrypt hash."""
+    return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+
+# bcrypt hashes look like `$2b$<rounds>$<salt and digest>`.
+_bcrypt_hash_rounds = re.compile(r"\$2[abxy]\$(\d{2})\$")
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Returns whether hash is not a bcrypt one or was made with other
+    rounds than configured ones, e.g. before they were changed."""
+    match = _bcrypt_hash_rounds.match(hashed_password)
+    return match is None or int(match[1]) != settings.bcrypt_rounds
+
+
+@cache
+def _get_dummy_password_hash() -> str:
+    """Returns hash of random password. Computed once, on first use."""
+    return _hash_password(secrets.token_urlsafe())
+
+
+async def hash_password(password: str) -> str:
+    """Hashes given password with bcrypt outside of the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, _hash_password, password
+    )
+
+
+async def get_dummy_password_hash() -> str:
+    """
+    Returns hash that no password matches. Used for verifying
+    credentials of missing users, so they take the same time.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, _get_dummy_password_hash
+    )
+
+
+def _cache_verification(cache_key: bytes, future: asyncio.Future) -> None:
+    """Caches password check once it is done, if it succeeded."""
+    if (
+        not future.cancelled()
+        and future.exception() is None
+        and future.result() is True
+    ):
+        _password_checks.set(cache_key, True)
+
+
+def verify_password(password: str, hashed_password: str) -> asyncio.Future:
+    """
+    Checks whether given password matches bcrypt hash.
+    Check starts in thread pool right away and returned future resolves
+    with its result, so caller may do other work before awaiting it.
+    Successful checks are cached.
+    """
+    loop = asyncio.get_running_loop()
+    cache_key = _password_cache_key(password, hashed_password)
+
+    if cache_key in _password_checks:
+        future = loop.create_future()
+        future.set_result(True)
+        return future
+
+    future = loop.run_in_executor(
+        _password_executor, _verify_password, password, hashed_password
+    )
+    future.add_done_callback(partial(_cache_verification, cache_key))
+    return future
+
+
+_jwt_digests = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64encode(data: bytes) -> bytes:
+    """Base64url encodes data without padding, as jwt requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# json.dumps builds new encoder per call when custom separators are given.
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
+# Header is the same for every token, so it is encoded once.
+_jwt_header = _b64encode(
+    _json_encoder.encode({"alg": JWT_ALGORITHM, "typ": "JWT"}).encode()
+)
+
+
+# Keyed hmac state is prepared once and copied for every signature.
+_jwt_hmac = hmac.new(
+    settings.secret_key.encode(), digestmod=_jwt_digests[JWT_ALGORITHM]
+)
+
+
+def _sign(signing_input: bytes) -> bytes:
+    """Returns hmac signature of given jwt signing input."""
+    signer = _jwt_hmac.copy()
+    signer.update(signing_input)
+    return signer.digest()
+
+
+# Jwt segments are unpadded base64url, nothing else is allowed in them.
+_b64url_segment = re.compile(rb"[A-Za-z0-9_-]*")
+
+
+def _b64decode(data: bytes) -> bytes:
+    """
+    Strictly decodes unpadded base64url data, as jwt requires.
+    Raises binascii.Error for padded, non-canonical
+    or containing foreign characters data.
+    """
+    if _b64url_segment.fullmatch(data) is None:
+        raise binascii.Error("Invalid base64url characters.")
+
+    decoded = base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+    # Unused trailing bits must be zero, so each value has one encoding.
+    if _b64encode(decoded) != data:
+        raise binascii.Error("Non-canonical base64url encoding.")
+
+    return decoded
+
+
+def encode_jwt(payload: Mapping[str, Any]) -> str:
+    """Encodes payload into jwt signed with secret key."""
+    signing_input = (
+        _jwt_header + b"." + _b64encode(_json_encoder.encode(payload).encode())
+    )
+    return (signing_input + b"." + _b64encode(_sign(signing_input))).decode()
+
+
+def decode_jwt(token: str) -> dict[str, Any]:
+    """
+    Decodes jwt signed with secret key and validates its exp claim.
+    Raises JWTError if token is malformed, has wrong signature
+    or algorithm, and ExpiredSignatureError if it is expired.
+    """
+    # Garbage is rejected before any decoding or hashing.
+    if len(token) > JWT_MAX_LENGTH or token.count(".") != 2:
+        raise JWTError("Malformed token.")
+
+    try:
+        signing_input, _, signature = token.encode().rpartition(b".")
+        header, _, payload = signing_input.partition(b".")
+
+        # Tokens issued by this app carry exactly the precomputed header.
+        if header != _jwt_header:
+            if json.loads(_b64decode(header)).get("alg") != JWT_ALGORITHM:
+                raise JWTError("The specified alg value is not allowed.")
+
+        if not hmac.compare_digest(
+            _sign(signing_input), _b64decode(signature)
+        ):
+            raise JWTError("Signature verification failed.")
+
+        claims = json.loads(_b64decode(payload))
+    except (binascii.Error, ValueError, AttributeError) as exc:
+        raise JWTError("Malformed token.") from exc
+
+    if not isinstance(claims, dict):
+        raise JWTError("Invalid payload.")
+
+    exp = claims.get("exp")
+
+    if not isinstance(exp, (int, float)):
+        raise JWTError("Expiration time claim is missing or invalid.")
+
+    if exp < time.time():
+        raise ExpiredSignatureError("Signature has expired.")
+
+    return claims
 
 
-class AuthTokenTypes(str, Enum):
+class AuthTokenTypes(IntEnum):
     """Enum class with authentication token types"""
 
-    ACCESS = "auth-access"
-    REFRESH = "aut-refresh"
+    ACCESS = 1
+    REFRESH = 2
 
 
 def _create_auth_token(
-    token_type: AuthTokenTypes, expires_delta: timedelta, user_id: int
+    token_type: AuthTokenTypes, lifetime: Seconds, user_id: int
 ) -> str:
     """
     Base function for creating authentication tokens
     (either access or refresh), for given user_id and expiration time.
     """
-    expire = datetime.utcnow() + expires_delta
     payload = {
         "user_id": user_id,
-        "expire": expire.isoformat(),
+        "exp": int(time.time()) + lifetime,
         "type": token_type,
     }
-    return jwt.encode(payload, settings.secret_key, algorithm=JWT_ALGORITHM)
+    return encode_jwt(payload)
 
 
 def create_access_token(user_id: int) -> str:
     """Creates access token for given user id."""
     return _create_auth_token(
-        AuthTokenTypes.ACCESS,
-        timedelta(seconds=JWT_ACCESS_TOKEN_EXPIRE),
-        user_id,
+        AuthTokenTypes.ACCESS, JWT_ACCESS_TOKEN_EXPIRE, user_id
     )
 
 
 def create_refresh_token(user_id: int) -> str:
     """Creates refresh token for given user id."""
     return _create_auth_token(
-        AuthTokenTypes.REFRESH,
-        timedelta(seconds=JWT_REFRESH_TOKEN_EXPIRE),
-        user_id,
+        AuthTokenTypes.REFRESH, JWT_REFRESH_TOKEN_EXPIRE, user_id
     )
 
 
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, status
+from typing import Any
+
+from fastapi import APIRouter, Depends, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from src.chatapp_api.auth.dependencies import get_auth_service
@@ -10,6 +12,18 @@ from src.chatapp_api.base.schemas import DetailMessage
 router = APIRouter(prefix="/api", tags=["auth"])
 
 
+def _user_with_tokens_response(data: dict[str, Any]) -> Response:
+    """
+    Serializes user with tokens in one pass, bypassing
+    fastapi's revalidation and jsonable_encoder of response model.
+    """
+    return Response(
+        UserWithTokens.parse_obj(data).json(by_alias=True),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
+
+
 @router.post(
     "/token",
     status_code=status.HTTP_201_CREATED,
@@ -31,9 +45,10 @@ async def token(
     - **password**: password of a user.
 
     """
-    return await auth_service.authenticate_user(
+    user_with_tokens = await auth_service.authenticate_user(
         credentials.username, credentials.password
     )
+    return _user_with_tokens_response(user_with_tokens)
 
 
 @router.post(
@@ -55,14 +70,18 @@ async def refresh(
     Creates access & refresh tokens based on refresh token.
     - **refresh_token**: refresh token
     """
-    return await auth_service.refresh_tokens(refresh_dto.refresh_token)
+    user_with_tokens = await auth_service.refresh_tokens(
+        refresh_dto.refresh_token
+    )
+    return _user_with_tokens_response(user_with_tokens)
 
 
 @router.post(
     "/validate",
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
     responses={
-        status.HTTP_400_BAD_REQUEST: {
+        status.HTTP_401_UNAUTHORIZED: {
             "model": DetailMessage,
             "description": "Bad access token",
         }
@@ -72,4 +91,6 @@ async def validate_access_token(
     access_token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service),
 ):
-    await auth_service.validate_access_token(access_token)
+    """Validates access token. Returns 401 if it is invalid or expired."""
+    auth_service.validate_access_token(access_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,51 +1,76 @@
 """
 Authentication module with all stuff related to authentication via jwt.
 """
+import hashlib
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from typing import Any, TypedDict
 
-from jose import JWTError, jwt
+from jose import JWTError
 
 from src.chatapp_api.auth.exceptions import BadTokenException
 from src.chatapp_api.auth.jwt import (
     AuthTokenTypes,
+    decode_jwt,
     generate_auth_tokens,
-    password_context,
+    get_dummy_password_hash,
+    password_needs_rehash,
+    verify_password,
 )
-from src.chatapp_api.config import JWT_ALGORITHM, settings
+from src.chatapp_api.config import JWT_DECODE_CACHE_SIZE, JWT_DECODE_CACHE_TTL
 from src.chatapp_api.user.exceptions import BadCredentialsException
 from src.chatapp_api.user.service import UserService
+from src.chatapp_api.utils import TTLCache
 
+# Digests of recently parsed valid tokens mapped to
+# (token type, user id, exp). Raw tokens are not kept in memory.
+_parsed_tokens: TTLCache[bytes, tuple[AuthTokenTypes, int, int]] = TTLCache(
+    maxsize=JWT_DECODE_CACHE_SIZE, ttl=JWT_DECODE_CACHE_TTL
+)
+
+
+class ParsedAuthToken(TypedDict):
+    """Typed dict with claims of parsed authentication token."""
 
-@dataclass
+    user_id: int
+    exp: int
+
+
+@dataclass(frozen=True, slots=True)
 class AuthService:
     """Auth service with auth related business logic."""
 
     user_service: UserService
 
     @staticmethod
-    def _parse_token(token_type: AuthTokenTypes, token: str) -> dict:
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[JWT_ALGORITHM]
-        )
+    def _parse_token(
+        token_type: AuthTokenTypes, token: str
+    ) -> ParsedAuthToken:
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = _parsed_tokens.get(cache_key)
 
-        user_id = payload.get("user_id")
-        curr_date = payload.get("expire")
+        if cached is not None:
+            cached_type, cached_user_id, cached_expire = cached
 
-        if curr_date is None or user_id is None:
-            raise JWTError
+            if cached_type == token_type and cached_expire > time.time():
+                return {"user_id": cached_user_id, "exp": cached_expire}
+
+        # Decoder validates exp claim itself, raising ExpiredSignatureError.
+        payload = decode_jwt(token)
 
-        is_expired = datetime.fromisoformat(curr_date) <= datetime.utcnow()
-        is_correct_type = payload.get("type") == token_type
+        user_id: int | None = payload.get("user_id")
+        expire: int = payload["exp"]
 
-        if is_expired is True or is_correct_type is False:
+        if user_id is None or payload.get("type") != token_type:
             raise JWTError
 
-        return {
-            "user_id": int(user_id),
-            "expire": datetime.fromisoformat(curr_date),
-        }
+        # Entry must not outlive the token itself.
+        _parsed_tokens.set(
+            cache_key,
+            (token_type, user_id, expire),
+            ttl=min(JWT_DECODE_CACHE_TTL, expire - time.time()),
+        )
+        return {"user_id": user_id, "exp": expire}
 
     def get_user_id_from_token(
         self, token_type: AuthTokenTypes, token: str
@@ -60,16 +85,28 @@ class AuthService:
         """Authenticates user with given username and password.
         Returns user if credentials are correct, otherwise raises 401"""
         user = await self.user_service.get_by_username(username)
+        hashed_password = (
+            user.password
+            if user is not None
+            else await get_dummy_password_hash()
+        )
+        verification = verify_password(password, hashed_password)
 
         if user is None:
+            await verification
             raise BadCredentialsException
 
-        is_password_matching = password_context.verify(password, user.password)
+        # Tokens are signed while bcrypt check runs in thread pool.
+        tokens = generate_auth_tokens(user.id)
 
-        if is_password_matching is False:
+        if await verification is False:
             raise BadCredentialsException
 
-        return {"user": user, **generate_auth_tokens(user.id)}
+        # Hashes made before rounds were changed are migrated on login.
+        if password_needs_rehash(user.password):
+            await self.user_service.rehash_password(user, password)
+
+        return {"user": user, **tokens}
 
     async def refresh_tokens(self, refresh_token: str) -> dict[str, Any]:
         """Returns new access and refresh tokens if refresh token is valid."""
@@ -82,8 +119,9 @@ class AuthService:
         except JWTError:
             raise BadTokenException
 
-    async def validate_access_token(self, access_token: str) -> None:
-        """validates access token, raises exception if it is invalid."""
+    def validate_access_token(self, access_token: str) -> None:
+        """validates access token, raises exception if it is invalid.
+        Recently validated tokens are answered from cache."""
         try:
             self._parse_token(AuthTokenTypes.ACCESS, access_token)
         except JWTError as exc:
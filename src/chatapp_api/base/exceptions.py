@@ -18,3 +18,15 @@ class NotFoundException(HTTPException):
         super().__init__(
             status.HTTP_404_NOT_FOUND, detail=detail, headers=headers
         )
+
+
+class InvalidCursorException(HTTPException):
+    """Raises http 400 bad request exception
+    for malformed pagination cursor."""
+
+    def __init__(self, headers: dict[str, Any] | None = None) -> None:
+        super().__init__(
+            status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+            headers=headers,
+        )
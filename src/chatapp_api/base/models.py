@@ -1,5 +1,8 @@
 """Base model class and utils."""
+from collections.abc import Callable
 from datetime import datetime
+from operator import attrgetter
+from typing import Any
 
 from sqlalchemy import func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -15,19 +18,31 @@ class CustomBase(DeclarativeBase):
 
     __abstract__ = True
     __repr_fields__: tuple[str, ...] = ("id",)
+    # Built once per class from `__repr_fields__`.
+    __repr_template__: str
+    __repr_values__: Callable[[Any], tuple[Any, ...]]
 
     id: Mapped[int] = mapped_column(primary_key=True)
     # id: Mapped[int_pk]
 
-    def __str__(self):
-        return self.__repr__()
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = cls.__repr_fields__
+        cls.__repr_template__ = (
+            f"{cls.__name__}("
+            + ", ".join(f"{field}: {{}}" for field in fields)
+            + ")"
+        )
+        # attrgetter returns bare value for a single field.
+        getter = attrgetter(*fields)
+        cls.__repr_values__ = staticmethod(
+            getter if len(fields) > 1 else lambda obj: (getter(obj),)
+        )
 
     def __repr__(self):
-        attrs = ", ".join(
-            f"{field}: {getattr(self, field)}"
-            for field in self.__repr_fields__
-        )
-        return f"{self.__class__.__name__}({attrs})"
+        return self.__repr_template__.format(*self.__repr_values__(self))
+
+    __str__ = __repr__
 
 
 class CreateTimestampMixin(CustomBase):
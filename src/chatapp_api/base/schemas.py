@@ -24,6 +24,9 @@ T = TypeVar("T", bound=BaseOrmModel)
 class PaginatedResponse(GenericModel, Generic[T]):
     """Pydantic model for validating paginatel list response."""
 
+    class Config:
+        orm_mode = True
+
     results: list[T]
     total_pages: int
     total_records: int
@@ -31,3 +34,15 @@ class PaginatedResponse(GenericModel, Generic[T]):
     items_per_page: int
     prev_page: str | None
     next_page: str | None
+
+
+class CursorPaginatedResponse(GenericModel, Generic[T]):
+    """Pydantic model for validating keyset paginated list response."""
+
+    class Config:
+        orm_mode = True
+
+    results: list[T]
+    items_per_page: int
+    next_cursor: str | None
+    next_page: str | None
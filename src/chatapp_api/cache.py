@@ -0,0 +1,116 @@
+"""Module with cache manager base and implementation classes."""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from aioredis import Redis
+from aioredis.exceptions import ConnectionError as RedisConnectionError
+from aioredis.exceptions import TimeoutError as RedisTimeoutError
+
+from src.chatapp_api.config import (
+    CACHE_VERSION_CACHE_SIZE,
+    CACHE_VERSION_TTL,
+    Seconds,
+)
+from src.chatapp_api.utils import TTLCache
+
+# Errors raised while cache server is unreachable. Cache is optional,
+# so callers fall back to uncached behaviour on them.
+CACHE_UNAVAILABLE_ERRORS = (RedisConnectionError, RedisTimeoutError)
+
+
+class BaseCacheManager(ABC):
+    """
+    Base class for cache managers storing serialized responses.
+    Entries are grouped into namespaces which are invalidated at once.
+    Key of entry is resolved once with make_key and reused for reading
+    and storing it, so value loaded before invalidation is never stored
+    under newer version of namespace.
+    Child classes must implement all its abstract methods.
+    """
+
+    @abstractmethod
+    async def make_key(self, namespace: str, key: str) -> str:
+        """Returns key of entry in current version of namespace."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Returns cached value or None if it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Seconds) -> None:
+        """Stores value for ttl seconds."""
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> None:
+        """Invalidates all entries of namespace."""
+
+
+@dataclass
+class RedisCacheManager(BaseCacheManager):
+    """
+    Redis cache manager. Shared by all workers.
+    Namespace is invalidated by bumping its version, so entries
+    of older versions are never read again and expire by ttl.
+    Versions are kept in process for version_ttl seconds, saving
+    a round trip per call, so invalidations made by other workers
+    are seen with that delay. Instance must be shared between requests.
+    """
+
+    redis: Redis
+    prefix: str = "cache"
+    version_ttl: Seconds = CACHE_VERSION_TTL
+    _versions: TTLCache[str, int] = field(init=False)
+
+    def __post_init__(self):
+        self._versions = TTLCache(CACHE_VERSION_CACHE_SIZE, self.version_ttl)
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:version"
+
+    async def make_key(self, namespace: str, key: str) -> str:
+        version = self._versions.get(namespace)
+
+        if version is None:
+            version = int(
+                await self.redis.get(self._version_key(namespace)) or 0
+            )
+            self._versions.set(namespace, version)
+
+        return f"{self.prefix}:{namespace}:{version}:{key}"
+
+    async def get(self, key: str) -> str | None:
+        value = await self.redis.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl: Seconds) -> None:
+        await self.redis.set(key, value, ex=ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        self._versions.set(
+            namespace, await self.redis.incr(self._version_key(namespace))
+        )
+
+
+@dataclass
+class LocalCacheManager(BaseCacheManager):
+    """Local cache manager. Keeps entries in memory of current process."""
+
+    maxsize: int = 1024
+    _cache: TTLCache[str, str] = field(init=False)
+    _versions: dict[str, int] = field(init=False, default_factory=dict)
+
+    def __post_init__(self):
+        # Every entry is stored with its own ttl.
+        self._cache = TTLCache(self.maxsize, 0)
+
+    async def make_key(self, namespace: str, key: str) -> str:
+        return f"{namespace}:{self._versions.get(namespace, 0)}:{key}"
+
+    async def get(self, key: str) -> str | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str, ttl: Seconds) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
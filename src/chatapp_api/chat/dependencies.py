@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.chatapp_api.auth.dependencies import (
     get_current_user_id_from_cookie_websocket,
 )
+from src.chatapp_api.cache import BaseCacheManager
 from src.chatapp_api.chat.repository import (
     ChatRepository,
     MembershipRepository,
@@ -19,10 +20,12 @@ from src.chatapp_api.chat.websocket_managers import (
 )
 from src.chatapp_api.dependencies import (
     get_broadcaster,
+    get_cache_manager,
     get_db_session,
+    get_keyset_paginator,
     get_paginator,
 )
-from src.chatapp_api.paginator import BasePaginator
+from src.chatapp_api.paginator import BasePaginator, KeysetPaginator
 from src.chatapp_api.user.dependencies import get_user_repository
 from src.chatapp_api.user.repository import UserRepository
 
@@ -37,7 +40,7 @@ def get_chat_repository(
 
 def get_message_repository(
     session: AsyncSession = Depends(get_db_session),
-    paginator: BasePaginator = Depends(get_paginator),
+    paginator: KeysetPaginator = Depends(get_keyset_paginator),
 ):
     """Message repository dependency injector"""
     return MessageRepository(session, paginator)
@@ -57,10 +60,14 @@ def get_chat_service(
     membership_repository: MembershipRepository = Depends(
         get_membership_repository
     ),
+    cache_manager: BaseCacheManager = Depends(get_cache_manager),
 ):
     """Chat service dependency injector"""
     return ChatService(
-        chat_repository, message_repository, membership_repository
+        chat_repository,
+        message_repository,
+        membership_repository,
+        cache_manager,
     )
 
 
@@ -39,6 +39,18 @@ class UserNotOwnerException(HTTPException):
         )
 
 
+class OwnerDemotionException(HTTPException):
+    """Http exception indicating that chat owner
+    can not be demoted from admins."""
+
+    def __init__(self, headers: dict[str, Any] | None = None) -> None:
+        super().__init__(
+            status.HTTP_403_FORBIDDEN,
+            "Owner cannot be demoted.",
+            headers,
+        )
+
+
 class UserNotMemberException(HTTPException):
     """Http exception indicating that action is
     available only for chat members."""
@@ -3,11 +3,15 @@ Module with chat related models.
 """
 from __future__ import annotations
 
-from datetime import datetime
 from typing import TYPE_CHECKING, Annotated
 
-from sqlalchemy import ForeignKey, Text, and_, func, select
-from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, Text, text
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+    query_expression,
+    relationship,
+)
 
 from src.chatapp_api.base.models import CreateTimestampMixin, CustomBase
 from src.chatapp_api.user.models import user_fk
@@ -24,6 +28,19 @@ class Membership(CustomBase):
     """Membership model storing m2m relation between user and chat."""
 
     __tablename__ = "membership"
+    __table_args__ = (
+        # Keeps user from joining chat twice and covers
+        # membership and role checks with index only scans.
+        Index(
+            "ix_membership_chat_id_user_id",
+            "chat_id",
+            "user_id",
+            unique=True,
+            postgresql_include=["is_admin", "is_owner"],
+        ),
+        # Serves lookups of chats of given user.
+        Index("ix_membership_user_id_chat_id", "user_id", "chat_id"),
+    )
     __repr_fields__ = ("id", "user_id", "chat_id")
 
     user_id: Mapped[user_fk]
@@ -39,6 +56,12 @@ class Message(CreateTimestampMixin, CustomBase):
     """Message model."""
 
     __tablename__ = "message"
+    __table_args__ = (
+        # Serves keyset pagination of chat messages, scanned backwards.
+        Index(
+            "ix_message_chat_id_created_at_id", "chat_id", "created_at", "id"
+        ),
+    )
 
     body: Mapped[str] = mapped_column(Text, nullable=False)
     sender_id: Mapped[user_fk]
@@ -51,42 +74,34 @@ class Chat(CreateTimestampMixin, CustomBase):
     """Chat model."""
 
     __tablename__ = "chat"
+    __table_args__ = (
+        # Trigram index serving substring search of public chats by name.
+        # Requires `pg_trgm` extension.
+        Index(
+            "ix_chat_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_where=text("NOT private"),
+        ),
+        # Lets private chat lookup probe private chats by id only.
+        Index("ix_chat_private", "id", postgresql_where=text("private")),
+    )
 
-    # Redefined `id` field for using in column_property
+    # Redefined `id` field for using in relationship
     id: Mapped[int] = mapped_column(primary_key=True)
     # id: Mapped[int_pk]
     name: Mapped[Annotated[str, 150] | None]
     private: Mapped[bool]
 
-    users_count: Mapped[int] = column_property(
-        select(func.count(Membership.user_id))
-        .where(Membership.chat_id == id)
-        .scalar_subquery(),
-        deferred=True,
-    )
-
-    last_message_id: Mapped[int] = column_property(
-        select(Message.id)
-        .where(
-            Message.created_at
-            == select(func.max(Message.created_at))
-            .where(Message.chat_id == id)
-            .correlate_except(Message)
-            .scalar_subquery()
-        )
-        .correlate_except(Message)
-        .scalar_subquery(),
-        deferred=True,
-    )
-    last_message_created_at: Mapped[datetime] = column_property(
-        select(func.max(Message.created_at))
-        .where(Message.chat_id == id)
-        .correlate_except(Message)
-        .scalar_subquery(),
-        deferred=True,
-    )
-    # TODO: problem with `id: Mapped[int_pk]`
-    last_message: Mapped[Message] = relationship(
-        primaryjoin=and_(Message.id == last_message_id, Message.chat_id == id),
+    # Extra fields below are computed by chat repository queries
+    # with lateral joins, a single set oriented plan for all rows.
+    users_count: Mapped[int] = query_expression()
+    # Populated with `contains_eager` from latest message lateral join.
+    # Never loaded lazily, as relationship alone can't tell the latest.
+    last_message: Mapped[Message | None] = relationship(
+        primaryjoin=lambda: Message.chat_id == Chat.id,
+        uselist=False,
         viewonly=True,
+        lazy="raise",
     )
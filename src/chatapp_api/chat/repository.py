@@ -1,14 +1,73 @@
 """Module with chat related repositories"""
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from typing import Any
 
-from sqlalchemy import and_, desc, exists, func, select
+from sqlalchemy import (
+    Exists,
+    Row,
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    lambda_stmt,
+    literal_column,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import defer, joinedload, undefer
+from sqlalchemy.orm import (
+    aliased,
+    contains_eager,
+    load_only,
+    raiseload,
+    selectinload,
+    with_expression,
+)
 
 from src.chatapp_api.base.repository import BaseRepository
 from src.chatapp_api.chat.models import Chat, Membership, Message
-from src.chatapp_api.paginator import BasePaginator, Page
+from src.chatapp_api.paginator import (
+    BasePaginator,
+    CursorPage,
+    KeysetPaginator,
+    Page,
+)
+from src.chatapp_api.user.models import User
+
+# Latest message of each chat, joined laterally to chat.
+_last_message = aliased(
+    Message,
+    select(Message)
+    .where(Message.chat_id == Chat.id)
+    .order_by(Message.created_at.desc(), Message.id.desc())
+    .limit(1)
+    .lateral("last_message"),
+)
+# Number of members of each chat, joined laterally to chat.
+_users_count = (
+    select(func.count(Membership.id).label("users_count"))
+    .where(Membership.chat_id == Chat.id)
+    .lateral("users_count")
+)
+
+
+# Columns of public chat listings. Fetched as rows, as listings
+# are read only, so orm instances and their identity map are not needed.
+_chat_with_users_count = select(
+    Chat.id, Chat.name, Chat.created_at, _users_count.c.users_count
+).join(_users_count, true())
+
+
+def _has_member(user_id: int) -> Exists:
+    """Returns EXISTS clause checking that given user is chat member.
+    Filtering by it keeps one row per chat without DISTINCT."""
+    return exists().where(
+        and_(Membership.chat_id == Chat.id, Membership.user_id == user_id)
+    )
 
 
 @dataclass
@@ -22,6 +81,50 @@ class ChatRepository(BaseRepository[Chat]):
         """Returns Chat with given id or none if not found."""
         return await self.session.get(Chat, id)
 
+    async def find_chat_with_role_of_user(
+        self, chat_id: int, user_id: int
+    ) -> Row[tuple[Chat, bool | None, bool | None]] | None:
+        """Returns chat with admin and owner flags of given user
+        in a single query. Flags are None if user is not chat member.
+        Returns None if chat is not found."""
+        return (
+            await self.session.execute(
+                select(Chat, Membership.is_admin, Membership.is_owner)
+                .outerjoin(
+                    Membership,
+                    and_(
+                        Membership.chat_id == Chat.id,
+                        Membership.user_id == user_id,
+                    ),
+                )
+                .where(Chat.id == chat_id)
+            )
+        ).one_or_none()
+
+    async def delete_chat_owned_by_user(
+        self, chat_id: int, user_id: int
+    ) -> bool:
+        """Deletes chat with given id if given user is its owner.
+        Memberships and messages are removed by cascading foreign keys.
+        Returns whether chat was deleted."""
+        result = await self.session.execute(
+            delete(Chat)
+            .where(
+                and_(
+                    Chat.id == chat_id,
+                    exists().where(
+                        and_(
+                            Membership.chat_id == chat_id,
+                            Membership.user_id == user_id,
+                            Membership.is_owner == True,  # noqa: E712
+                        )
+                    ),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
     async def commit_or_throw(self, exception: BaseException) -> None:
         """Commits to database or rollbacks and throws given
         exception if Integrity exception occurs."""
@@ -35,17 +138,20 @@ class ChatRepository(BaseRepository[Chat]):
         self, user1_id: int, user2_id: int
     ) -> Chat | None:
         """Returns private chat of two given users."""
+        user_ids = [user1_id, user2_id]
         return await self.session.scalar(
-            select(Chat).from_statement(
-                select(Chat)
-                .distinct()
+            lambda_stmt(
+                lambda: select(Chat)
                 .join(Membership, Membership.chat_id == Chat.id)
-                .where(Membership.user_id == user1_id)
-                .intersect(
-                    select(Chat)
-                    .join(Membership, Membership.chat_id == Chat.id)
-                    .where(Membership.user_id == user2_id)
+                .where(
+                    and_(
+                        Chat.private == True,  # noqa: E712
+                        Membership.user_id.in_(user_ids),
+                    )
                 )
+                .group_by(Chat.id)
+                .having(func.count(func.distinct(Membership.user_id)) == 2)
+                .limit(1)
             )
         )
 
@@ -60,39 +166,33 @@ class ChatRepository(BaseRepository[Chat]):
             )
         ) or False
 
-    async def find_all_chats(self) -> Page[Chat]:
-        """Returns all chats from given page."""
-        return await self.paginator.get_page_for_model(
-            select(Chat)
-            .options(undefer(Chat.users_count))
-            .where(Chat.private == False)  # noqa: E712
+    async def find_all_chats(self) -> Page[Row]:
+        """Returns rows of all public chats from given page."""
+        return await self.paginator.get_page_for_rows(
+            _chat_with_users_count.where(Chat.private == False)  # noqa: E712
         )
 
-    async def find_all_chats_matching_keyword(
-        self, keyword: str
-    ) -> Page[Chat]:
-        """Returns chats that match keyword."""
-        return await self.paginator.get_page_for_model(
-            select(Chat)
-            .options(undefer(Chat.users_count))
-            .where(
+    async def find_all_chats_matching_keyword(self, keyword: str) -> Page[Row]:
+        """Returns rows of public chats that match keyword."""
+        return await self.paginator.get_page_for_rows(
+            _chat_with_users_count.where(
                 and_(
                     Chat.private == False,  # noqa: E712
-                    func.upper(Chat.name).like(f"%{keyword.upper()}%"),
+                    Chat.name.ilike(f"%{keyword}%"),
                 )
             )
         )
 
     async def find_chat_by_id_with_extra(self, id: int) -> Chat | None:
-        """Returns chats by id with calculated
-        with users count and last message.
-        Returns None if not found."""
+        """Returns chats by id with calculated users count.
+        Last message is not shown in chat details, so it is left
+        on raiseload. Returns None if not found."""
         return await self.session.scalar(
             select(Chat)
-            .distinct()
+            .join(_users_count, true())
             .options(
-                undefer(Chat.users_count),
-                joinedload(Chat.last_message),
+                with_expression(Chat.users_count, _users_count.c.users_count),
+                raiseload("*"),
             )
             .where(Chat.id == id)
         )
@@ -102,17 +202,17 @@ class ChatRepository(BaseRepository[Chat]):
         Orders messages by the date of the last message."""
         return await self.paginator.get_page_for_model(
             select(Chat)
-            .distinct()
-            .join(Membership, Membership.chat_id == Chat.id)
+            .outerjoin(_last_message, true())
             .options(
-                joinedload(Chat.last_message).joinedload(Message.sender),
+                contains_eager(
+                    Chat.last_message.of_type(_last_message)
+                ).selectinload(_last_message.sender),
+                raiseload("*"),
             )
-            .where(Membership.user_id == user_id)
+            .where(_has_member(user_id))
             .order_by(
-                desc(
-                    func.coalesce(Chat.last_message_created_at, datetime.min)
-                ),
-                desc(Chat.last_message_created_at),
+                _last_message.created_at.desc().nullslast(),
+                Chat.id.desc(),
             )
         )
 
@@ -124,22 +224,22 @@ class ChatRepository(BaseRepository[Chat]):
         date of the last message."""
         return await self.paginator.get_page_for_model(
             select(Chat)
-            .distinct()
-            .join(Membership, Membership.chat_id == Chat.id)
+            .outerjoin(_last_message, true())
             .options(
-                joinedload(Chat.last_message).joinedload(Message.sender),
+                contains_eager(
+                    Chat.last_message.of_type(_last_message)
+                ).selectinload(_last_message.sender),
+                raiseload("*"),
             )
             .where(
                 and_(
-                    Membership.user_id == user_id,
-                    func.upper(Chat.name).like(f"%{keyword.upper()}%"),
+                    _has_member(user_id),
+                    Chat.name.ilike(f"%{keyword}%"),
                 )
             )
             .order_by(
-                desc(
-                    func.coalesce(Chat.last_message_created_at, datetime.min)
-                ),
-                desc(Chat.last_message_created_at),
+                _last_message.created_at.desc().nullslast(),
+                Chat.id.desc(),
             )
         )
 
@@ -155,21 +255,172 @@ class MembershipRepository(BaseRepository[Membership]):
     ) -> Membership | None:
         """Returns membership from chat or None if not found."""
         return await self.session.scalar(
-            select(Membership).where(
-                and_(
-                    Membership.chat_id == chat_id,
-                    Membership.user_id == user_id,
+            lambda_stmt(
+                lambda: select(Membership).where(
+                    and_(
+                        Membership.chat_id == chat_id,
+                        Membership.user_id == user_id,
+                    )
+                )
+            )
+        )
+
+    async def exists_member(self, user_id: int, chat_id: int) -> bool:
+        """Returns whether user is member of given chat."""
+        return (
+            await self.session.scalar(
+                lambda_stmt(
+                    lambda: select(literal_column("1"))
+                    .where(
+                        and_(
+                            Membership.chat_id == chat_id,
+                            Membership.user_id == user_id,
+                        )
+                    )
+                    .limit(1)
                 )
             )
+        ) is not None
+
+    async def insert_many_or_throw(
+        self, values: Sequence[dict[str, Any]], exception: BaseException
+    ) -> None:
+        """Inserts memberships with given values in a single statement.
+        Rollbacks and throws given exception if Integrity exception occurs,
+        e.g. one of the users does not exist."""
+        try:
+            await self.session.execute(insert(Membership), values)
+        except IntegrityError as exc:
+            await self.rollback()
+            raise exception from exc
+
+    async def insert_if_not_member(
+        self, values: dict[str, Any]
+    ) -> Membership | None:
+        """Inserts membership with given values in a single
+        INSERT ... ON CONFLICT DO NOTHING statement.
+        Returns None if user is already chat member."""
+        return await self.session.scalar(
+            pg_insert(Membership)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["chat_id", "user_id"])
+            .returning(Membership)
+        )
+
+    async def find_member_with_role_of_user(
+        self, chat_id: int, user_id: int, target_id: int
+    ) -> Row[tuple[Membership | None, bool]] | None:
+        """Returns target's membership along with admin flag
+        of given user in a single query. Membership is None if target
+        is not chat member. Returns None if user is not chat member."""
+        requester = aliased(Membership)
+        return (
+            await self.session.execute(
+                select(Membership, requester.is_admin)
+                .select_from(requester)
+                .outerjoin(
+                    Membership,
+                    and_(
+                        Membership.chat_id == requester.chat_id,
+                        Membership.user_id == target_id,
+                    ),
+                )
+                .where(
+                    and_(
+                        requester.chat_id == chat_id,
+                        requester.user_id == user_id,
+                    )
+                )
+            )
+        ).one_or_none()
+
+    @staticmethod
+    def _is_admin_of_chat(chat_id: int, user_id: int):
+        """Returns condition checking that given user is chat admin."""
+        requester = aliased(Membership)
+        return exists().where(
+            and_(
+                requester.chat_id == chat_id,
+                requester.user_id == user_id,
+                requester.is_admin == True,  # noqa: E712
+            )
         )
 
+    async def update_member_if_admin(
+        self,
+        chat_id: int,
+        user_id: int,
+        target_id: int,
+        is_admin: bool | None,
+    ) -> Membership | None:
+        """Updates admin status of target's membership in a single
+        UPDATE ... RETURNING statement, if given user is chat admin.
+        Status is kept as is if None is given. Owner is never demoted.
+        Returns updated membership with loaded user
+        or None if nothing was updated."""
+        conditions = [
+            Membership.chat_id == chat_id,
+            Membership.user_id == target_id,
+            self._is_admin_of_chat(chat_id, user_id),
+        ]
+        if is_admin is False:
+            conditions.append(Membership.is_owner == False)  # noqa: E712
+
+        return await self.session.scalar(
+            update(Membership)
+            .where(and_(*conditions))
+            .values(
+                is_admin=Membership.is_admin if is_admin is None else is_admin
+            )
+            .returning(Membership)
+            .options(selectinload(Membership.user), raiseload("*")),
+            execution_options={"populate_existing": True},
+        )
+
+    async def delete_member_if_allowed(
+        self, chat_id: int, user_id: int, target_id: int
+    ) -> bool:
+        """Deletes target's non owner membership in a single statement,
+        if given user is target itself or chat admin.
+        Returns whether membership was deleted."""
+        conditions = [
+            Membership.chat_id == chat_id,
+            Membership.user_id == target_id,
+            Membership.is_owner == False,  # noqa: E712
+        ]
+        if user_id != target_id:
+            conditions.append(self._is_admin_of_chat(chat_id, user_id))
+
+        result = await self.session.execute(
+            delete(Membership)
+            .where(and_(*conditions))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
     async def find_members_by_chat_id(self, id: int) -> Page[Membership]:
         """Finds memberships from given chat.
-        Joins membership with user entity."""
+        Loads users of memberships in a separate query.
+        Only columns shown in member list are loaded,
+        leaving out password hashes."""
         return await self.paginator.get_page_for_model(
             select(Membership)
-            .distinct()
-            .options(joinedload(Membership.user))
+            .options(
+                load_only(
+                    Membership.chat_id,
+                    Membership.user_id,
+                    Membership.is_admin,
+                    Membership.is_owner,
+                ),
+                selectinload(Membership.user).load_only(
+                    User.username,
+                    User.email,
+                    User.first_name,
+                    User.last_name,
+                    User.profile_picture,
+                ),
+                raiseload("*"),
+            )
             .where(Membership.chat_id == id)
         )
 
@@ -178,30 +429,30 @@ class MembershipRepository(BaseRepository[Membership]):
 class MessageRepository(BaseRepository[Message]):
     """Repository for message model."""
 
-    paginator: BasePaginator
+    paginator: KeysetPaginator
 
     async def find_messages_by_private_chat_id(
         self, chat_id: int
-    ) -> Page[Message]:
+    ) -> CursorPage[Message]:
         """Returns messages from private chat.
         Orders by the descending message creation dates."""
         return await self.paginator.get_page_for_model(
             select(Message)
-            .distinct()
-            .options(joinedload(Message.sender), defer(Message.sender_id))
-            .where(Message.chat_id == chat_id)
-            .order_by(Message.created_at.desc())
+            .options(selectinload(Message.sender), raiseload("*"))
+            .where(Message.chat_id == chat_id),
+            Message.created_at,
+            Message.id,
         )
 
     async def find_messages_by_public_chat_id(
         self, chat_id: int
-    ) -> Page[Message]:
+    ) -> CursorPage[Message]:
         """Returns messages from public chat.
         Orders by the descending message creation dates."""
         return await self.paginator.get_page_for_model(
             select(Message)
-            .options(joinedload(Message.sender), defer(Message.sender_id))
-            .where(Message.chat_id == chat_id)
-            .order_by(Message.created_at.desc())
-            .distinct()
+            .options(selectinload(Message.sender), raiseload("*"))
+            .where(Message.chat_id == chat_id),
+            Message.created_at,
+            Message.id,
         )
@@ -1,8 +1,19 @@
 """Module with Chat API Routes & Websockets"""
-from fastapi import APIRouter, Depends, Form, status
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any
+from urllib import parse
+
+from fastapi import APIRouter, Depends, Form, Request, Response, status
+from pydantic import BaseModel
 
 from src.chatapp_api.auth.dependencies import get_current_user_id_from_bearer
-from src.chatapp_api.base.schemas import DetailMessage, PaginatedResponse
+from src.chatapp_api.base.schemas import (
+    CursorPaginatedResponse,
+    DetailMessage,
+    PaginatedResponse,
+)
+from src.chatapp_api.cache import CACHE_UNAVAILABLE_ERRORS, BaseCacheManager
 from src.chatapp_api.chat.dependencies import (
     get_chat_service,
     get_notification_messaging_manager,
@@ -22,10 +33,65 @@ from src.chatapp_api.chat.schemas import (
 )
 from src.chatapp_api.chat.service import ChatService
 from src.chatapp_api.chat.websocket_managers import AsyncWebsocketManager
+from src.chatapp_api.config import (
+    PUBLIC_CHATS_CACHE_NAMESPACE,
+    PUBLIC_CHATS_CACHE_TTL,
+)
+from src.chatapp_api.dependencies import get_cache_manager, get_paginator
+from src.chatapp_api.paginator import LimitOffsetPaginator
 
 router = APIRouter(prefix="/api", tags=["chat"])
 
 
+def _json_response(schema: type[BaseModel], obj: Any) -> Response:
+    """
+    Serializes orm object with given schema in one pass, bypassing
+    fastapi's revalidation and jsonable_encoder of response model.
+    """
+    return Response(
+        schema.from_orm(obj).json(by_alias=True),
+        media_type="application/json",
+    )
+
+
+async def _cached_public_chats_response(
+    request: Request,
+    cache_manager: BaseCacheManager,
+    schema: type[BaseModel],
+    load: Callable[[], Awaitable[Any]],
+    **params: str | int | None,
+) -> Response:
+    """
+    Returns public chats response serialized with given schema.
+    Body is cached by request path and given query params, which
+    endpoint reads, until ttl passes or chats change. Requests with
+    other query params are not cached, as pagination links keep them.
+    """
+    if not set(request.query_params) <= params.keys():
+        return _json_response(schema, await load())
+
+    query = parse.urlencode(
+        {name: value for name, value in params.items() if value is not None}
+    )
+
+    try:
+        key = await cache_manager.make_key(
+            PUBLIC_CHATS_CACHE_NAMESPACE, f"{request.url.path}?{query}"
+        )
+        body = await cache_manager.get(key)
+    except CACHE_UNAVAILABLE_ERRORS:
+        # Chats are served from db while cache is down.
+        return _json_response(schema, await load())
+
+    if body is None:
+        body = schema.from_orm(await load()).json(by_alias=True)
+
+        with suppress(*CACHE_UNAVAILABLE_ERRORS):
+            await cache_manager.set(key, body, PUBLIC_CHATS_CACHE_TTL)
+
+    return Response(body, media_type="application/json")
+
+
 @router.websocket("/chats/users/{target_id}", name="Private messaging")
 async def private_messaging(
     manager: AsyncWebsocketManager = Depends(
@@ -39,12 +105,16 @@ async def private_messaging(
 
 @router.get(
     "/chats/users/{target_id}/messages",
-    response_model=PaginatedResponse[MessageRead],
+    response_model=CursorPaginatedResponse[MessageRead],
     responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": DetailMessage,
+            "description": "Invalid pagination cursor.",
+        },
         status.HTTP_404_NOT_FOUND: {
             "model": DetailMessage,
             "description": "Chat with target user does not exist.",
-        }
+        },
     },
 )
 async def get_private_messages_from_user(
@@ -52,8 +122,12 @@ async def get_private_messages_from_user(
     user_id: int = Depends(get_current_user_id_from_bearer),
     chat_service: ChatService = Depends(get_chat_service),
 ):
-    """Returns messages with target user."""
-    return await chat_service.list_private_chat_messages(user_id, target_id)
+    """Returns messages with target user, newest first.
+    Next page is requested with `cursor` from previous page."""
+    return _json_response(
+        CursorPaginatedResponse[MessageRead],
+        await chat_service.list_private_chat_messages(user_id, target_id),
+    )
 
 
 @router.websocket("/chats/{chat_id}")
@@ -69,11 +143,22 @@ async def public_chat_messaging(
 
 @router.get("/chats", response_model=PaginatedResponse[ChatReadWithUsersCount])
 async def list_public_chats(
+    request: Request,
     keyword: str | None = None,
     chat_service: ChatService = Depends(get_chat_service),
+    paginator: LimitOffsetPaginator = Depends(get_paginator),
+    cache_manager: BaseCacheManager = Depends(get_cache_manager),
 ):
     """List public chats as well as search through them."""
-    return await chat_service.list_chats(keyword)
+    return await _cached_public_chats_response(
+        request,
+        cache_manager,
+        PaginatedResponse[ChatReadWithUsersCount],
+        lambda: chat_service.list_chats(keyword),
+        keyword=keyword,
+        page=paginator.page,
+        page_size=paginator.page_size,
+    )
 
 
 @router.post(
@@ -113,13 +198,20 @@ async def create_public_chat(
     },
 )
 async def get_public_chat(
+    request: Request,
     chat_id: int,
     chat_service: ChatService = Depends(get_chat_service),
+    cache_manager: BaseCacheManager = Depends(get_cache_manager),
 ):
     """Get public chat detail with given id.
     If no public chat is found returns 404."""
-    return await chat_service.get_public_chat_with_members_count_or_404(
-        chat_id
+    return await _cached_public_chats_response(
+        request,
+        cache_manager,
+        ChatReadWithUsersCount,
+        lambda: chat_service.get_public_chat_with_members_count_or_404(
+            chat_id
+        ),
     )
 
 
@@ -212,7 +304,7 @@ async def enroll_into_chat(
     responses={
         status.HTTP_403_FORBIDDEN: {
             "model": DetailMessage,
-            "description": "User is not admin.",
+            "description": "User is not admin or target is owner.",
         },
         status.HTTP_404_NOT_FOUND: {
             "model": DetailMessage,
@@ -257,12 +349,16 @@ async def remove_chat_member(
 
 @router.get(
     "/chats/{chat_id}/messages",
-    response_model=PaginatedResponse[MessageRead],
+    response_model=CursorPaginatedResponse[MessageRead],
     responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": DetailMessage,
+            "description": "Invalid pagination cursor.",
+        },
         status.HTTP_403_FORBIDDEN: {
             "model": DetailMessage,
             "description": "User is not chat member.",
-        }
+        },
     },
 )
 async def list_chat_messages(
@@ -270,9 +366,13 @@ async def list_chat_messages(
     user_id: int = Depends(get_current_user_id_from_bearer),
     chat_service: ChatService = Depends(get_chat_service),
 ):
-    """Lists chat messages. If user is not chat member,
+    """Lists chat messages, newest first. Next page is requested
+    with `cursor` from previous page. If user is not chat member,
     returns 403 http error code."""
-    return await chat_service.list_public_chat_messages(chat_id, user_id)
+    return _json_response(
+        CursorPaginatedResponse[MessageRead],
+        await chat_service.list_public_chat_messages(chat_id, user_id),
+    )
 
 
 @router.get(
@@ -292,7 +392,10 @@ async def list_chat_members(
 ):
     """Lists chat members. If user is not chat member,
     returns 403 http error code."""
-    return await chat_service.list_chat_members(chat_id, user_id)
+    return _json_response(
+        PaginatedResponse[MembershipRead],
+        await chat_service.list_chat_members(chat_id, user_id),
+    )
 
 
 @router.get(
@@ -305,7 +408,10 @@ async def list_user_chats(
     chat_service: ChatService = Depends(get_chat_service),
 ):
     """Returns auth user's chats sorted by the date of their last message."""
-    return await chat_service.list_user_chats(user_id, keyword)
+    return _json_response(
+        PaginatedResponse[ChatReadWithLastMessage],
+        await chat_service.list_user_chats(user_id, keyword),
+    )
 
 
 @router.websocket("/chats/notifications", name="Notifications receiver")
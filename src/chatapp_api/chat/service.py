@@ -1,16 +1,21 @@
 """Service for chat related models & routes."""
+import time
 from collections.abc import Sequence
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from typing import TypedDict, cast
 
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
+from jose import JWTError
+from sqlalchemy import Row
 
+from src.chatapp_api.auth.jwt import decode_jwt, encode_jwt
 from src.chatapp_api.base.exceptions import NotFoundException
+from src.chatapp_api.cache import CACHE_UNAVAILABLE_ERRORS, BaseCacheManager
 from src.chatapp_api.chat.exceptions import (
     BadInviteTokenException,
     ChatNameTakenException,
+    OwnerDemotionException,
     UserNotAdminException,
     UserNotMemberException,
     UserNotOwnerException,
@@ -24,10 +29,9 @@ from src.chatapp_api.chat.repository import (
 from src.chatapp_api.chat.schemas import MembershipCreate
 from src.chatapp_api.config import (
     CHAT_INVITE_LINK_DURATION,
-    JWT_ALGORITHM,
-    settings,
+    PUBLIC_CHATS_CACHE_NAMESPACE,
 )
-from src.chatapp_api.paginator import Page
+from src.chatapp_api.paginator import CursorPage, Page
 
 
 class InvitationJWT(TypedDict):
@@ -35,16 +39,25 @@ class InvitationJWT(TypedDict):
 
     type: str
     chat_id: int
-    expire: str
+    exp: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChatService:
     """Chat service with related business logic."""
 
     chat_repository: ChatRepository
     message_repository: MessageRepository
     membership_repository: MembershipRepository
+    cache_manager: BaseCacheManager
+
+    async def _invalidate_public_chats(self) -> None:
+        """Invalidates cached public chat responses.
+        Must be called after changes of chats or their members.
+        Changes are committed by then, so unreachable cache does not
+        fail the request and its entries expire by ttl instead."""
+        with suppress(*CACHE_UNAVAILABLE_ERRORS):
+            await self.cache_manager.invalidate(PUBLIC_CHATS_CACHE_NAMESPACE)
 
     async def _create_private_chat(
         self, user_1_id: int, user_2_id: int
@@ -92,7 +105,7 @@ class ChatService:
 
     async def list_private_chat_messages(
         self, user_id: int, target_id: int
-    ) -> Page[Message]:
+    ) -> CursorPage[Message]:
         """Returns messages from a private chat with a given id."""
         if (
             chat := await self.chat_repository.find_private_chat(
@@ -109,11 +122,7 @@ class ChatService:
 
     async def is_chat_member(self, user_id: int, chat_id: int) -> bool:
         """Returns whether given chat has given user."""
-        return (
-            await self.membership_repository.find_member_by_chat_and_user_id(
-                user_id, chat_id
-            )
-        ) is not None
+        return await self.membership_repository.exists_member(user_id, chat_id)
 
     async def is_chat_admin(self, user_id: int, chat_id: int) -> bool:
         """Returns whether given chat has given admin user."""
@@ -133,7 +142,7 @@ class ChatService:
         )
         return membership is not None and membership.is_owner is True
 
-    async def list_chats(self, keyword: str | None = None) -> Page[Chat]:
+    async def list_chats(self, keyword: str | None = None) -> Page[Row]:
         """Returns list of all records.
         If keyword passed returns matching chats only."""
         if keyword:
@@ -153,27 +162,38 @@ class ChatService:
         if await self.chat_repository.exists_chat_with_name_and_id_not(name):
             raise ChatNameTakenException
 
+        # Membership is unique per chat and user, so repeated
+        # members and owner passed as member are added once.
+        members_is_admin = {
+            member.id: member.is_admin
+            for member in members
+            if member.id != user_id
+        }
         chat = Chat(private=False, name=name)
         self.chat_repository.add(chat)
         await self.chat_repository.flush()
-        self.membership_repository.add(
-            Membership(
-                chat_id=chat.id, user_id=user_id, is_admin=True, is_owner=True
-            )
-        )
-        self.membership_repository.add_all(
-            Membership(
-                chat_id=chat.id,
-                user_id=member.id,
-                is_admin=member.is_admin,
-            )
-            for member in filter(lambda member: member.id != user_id, members)
-            # Add all users from members but exclude if owner is there
-        )
-
-        await self.chat_repository.commit_or_throw(
-            NotFoundException("Nonexistent user passed as a member.")
+        await self.membership_repository.insert_many_or_throw(
+            [
+                {
+                    "chat_id": chat.id,
+                    "user_id": user_id,
+                    "is_admin": True,
+                    "is_owner": True,
+                },
+                *(
+                    {
+                        "chat_id": chat.id,
+                        "user_id": member_id,
+                        "is_admin": is_admin,
+                        "is_owner": False,
+                    }
+                    for member_id, is_admin in members_is_admin.items()
+                ),
+            ],
+            NotFoundException("Nonexistent user passed as a member."),
         )
+        await self.chat_repository.commit()
+        await self._invalidate_public_chats()
 
         return chat
 
@@ -196,46 +216,48 @@ class ChatService:
         self, user_id: int, chat_id: int, name: str | None = None
     ) -> Chat:
         """Updates chat's information."""
-        if (chat := await self.chat_repository.find_by_id(chat_id)) is None:
+        row = await self.chat_repository.find_chat_with_role_of_user(
+            chat_id, user_id
+        )
+
+        if row is None:
             raise NotFoundException(
                 "Public chat with given id has not been found."
             )
 
-        if not await self.is_chat_admin(user_id, chat_id):
+        chat, is_admin, _ = row
+
+        if not is_admin:
             raise UserNotAdminException
 
         if name:
             chat.name = name
 
         await self.chat_repository.commit()
-        await self.chat_repository.refresh(chat)
+        await self._invalidate_public_chats()
         return chat
 
     async def delete_chat(self, user_id: int, chat_id: int) -> None:
-        """Deletes public chat with given id.
-        If chat doesn't exist, raises 404 http exception."""
-        if not await self.is_chat_owner(user_id, chat_id):
+        """Deletes public chat with given id. If chat doesn't exist
+        or user is not its owner, raises 403 http exception."""
+        if not await self.chat_repository.delete_chat_owned_by_user(
+            chat_id, user_id
+        ):
             raise UserNotOwnerException
 
-        if (chat := await self.chat_repository.find_by_id(chat_id)) is None:
-            raise NotFoundException
-
-        await self.chat_repository.delete(chat)
         await self.chat_repository.commit()
+        await self._invalidate_public_chats()
 
     def _generate_invite_token(
         self, chat_id: int, expiration_time: int = CHAT_INVITE_LINK_DURATION
     ) -> str:
         """Generates invite token for given chat."""
-        expire = datetime.utcnow() + timedelta(seconds=expiration_time)
-        payload = {
+        payload: InvitationJWT = {
             "type": "chat-invitation",
             "chat_id": chat_id,
-            "expire": expire.isoformat(),
+            "exp": int(time.time()) + expiration_time,
         }
-        return jwt.encode(
-            payload, settings.secret_key, algorithm=JWT_ALGORITHM
-        )
+        return encode_jwt(payload)
 
     async def get_invite_link_for_chat(
         self, user_id: int, chat_id: int
@@ -253,36 +275,35 @@ class ChatService:
         """Enrolls user to chat. If token cannot be
         parsed or expired or is invalid, 400 http error is raised.
         If user is already in chat, 409 http error is raised."""
-        if await self.is_chat_member(user_id, chat_id):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="You are already enrolled in this chat.",
-            )
-
         try:
-            body = cast(
-                InvitationJWT,
-                jwt.decode(token, settings.secret_key, JWT_ALGORITHM),
-            )
+            body = cast(InvitationJWT, decode_jwt(token))
         except JWTError as exc:
             raise BadInviteTokenException from exc
 
-        is_chat_invitation_type = body["type"] == "chat-invitation"
-        is_expired = datetime.fromisoformat(body["expire"]) > datetime.utcnow()
-        is_target_chat = chat_id == body["chat_id"]
-
-        if not all([is_chat_invitation_type, is_expired, is_target_chat]):
+        if (
+            body.get("chat_id") != chat_id
+            or body.get("type") != "chat-invitation"
+        ):
             raise BadInviteTokenException
 
-        membership = Membership(
-            chat_id=chat_id,
-            user_id=user_id,
-            is_admin=False,
-            is_owner=False,
-            accepted=True,
+        membership = await self.membership_repository.insert_if_not_member(
+            {
+                "chat_id": chat_id,
+                "user_id": user_id,
+                "is_admin": False,
+                "is_owner": False,
+                "accepted": True,
+            }
         )
-        self.membership_repository.add(membership)
+
+        if membership is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="You are already enrolled in this chat.",
+            )
+
         await self.membership_repository.commit()
+        await self._invalidate_public_chats()
         return membership
 
     async def update_membership(
@@ -293,57 +314,62 @@ class ChatService:
         is_admin: bool | None = None,
     ) -> Membership:
         """Updates chat member's information, his admin, owner status.
-        If User is not chat admin raises 403.
-        If non owner tries to make someone owner raises 403."""
-        if not await self.is_chat_admin(user_id, chat_id):
-            raise UserNotAdminException
-
-        membership = (
-            await self.membership_repository.find_member_by_chat_and_user_id(
-                target_id, chat_id
-            )
+        If User is not chat admin or tries to demote owner raises 403."""
+        membership = await self.membership_repository.update_member_if_admin(
+            chat_id, user_id, target_id, is_admin
         )
 
         if membership is None:
-            raise NotFoundException("Member not found.")
+            # Nothing was updated, find out why.
+            row = (
+                await self.membership_repository.find_member_with_role_of_user(
+                    chat_id, user_id, target_id
+                )
+            )
+            if row is None or not row.is_admin:
+                raise UserNotAdminException
 
-        if is_admin:
-            membership.is_admin = is_admin
+            if row.Membership is None:
+                raise NotFoundException("Member not found.")
+
+            raise OwnerDemotionException
 
-        self.membership_repository.add(membership)
         await self.membership_repository.commit()
-        await self.membership_repository.refresh(membership)
         return membership
 
     async def remove_member(
         self, chat_id: int, user_id: int, target_id: int
     ) -> None:
-        """Removes given user from chat. If user is not admin raises 403."""
-        if user_id != target_id or not self.is_chat_admin(user_id, chat_id):
-            raise UserNotAdminException
-
-        membership = (
-            await self.membership_repository.find_member_by_chat_and_user_id(
-                target_id, chat_id
-            )
+        """Removes given user from chat. Members can leave chat,
+        but removing others requires admin rights, otherwise raises 403."""
+        if await self.membership_repository.delete_member_if_allowed(
+            chat_id, user_id, target_id
+        ):
+            await self.membership_repository.commit()
+            await self._invalidate_public_chats()
+            return
+
+        # Nothing was deleted, find out why.
+        row = await self.membership_repository.find_member_with_role_of_user(
+            chat_id, user_id, target_id
         )
 
-        if membership is None:
+        if row is None or (user_id != target_id and not row.is_admin):
+            raise UserNotAdminException
+
+        if row.Membership is None:
             raise NotFoundException(
                 "Member with given id cannot be found in chat."
             )
-        if membership.is_owner is True:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Owner cannot be removed from group.",
-            )
 
-        await self.membership_repository.delete(membership)
-        await self.membership_repository.commit()
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Owner cannot be removed from group.",
+        )
 
     async def list_public_chat_messages(
         self, chat_id: int, user_id: int
-    ) -> Page[Message]:
+    ) -> CursorPage[Message]:
         """Lists messages from public chat,
         if user is not chat member, raises 403."""
         if not await self.is_chat_member(user_id, chat_id):
@@ -2,7 +2,7 @@
 import asyncio
 import json
 from dataclasses import dataclass, field
-from typing import Literal, Protocol
+from typing import Any, Literal, Protocol
 
 from broadcaster import Broadcast  # type: ignore
 from fastapi import WebSocket, WebSocketDisconnect
@@ -18,6 +18,10 @@ from src.chatapp_api.chat.service import ChatService
 from src.chatapp_api.user.repository import UserRepository
 from src.chatapp_api.user.schemas import UserRead
 
+# Same compact format as `WebSocket.send_json`, so published
+# messages are forwarded to subscribers as they are.
+_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 class MessageBody(BaseModel):
     """Pyndatic model for validating message payload in websockets managers."""
@@ -64,6 +68,8 @@ class PrivateChatMessagingManager(
     user_id: int
     target_id: int
     chat: Chat | None = field(init=False, default=None)
+    # Sender info attached to every message, resolved once on accept.
+    user_payload: dict[str, Any] = field(init=False, default_factory=dict)
 
     @staticmethod
     def _get_channel_for_user(user_id: int):
@@ -71,12 +77,16 @@ class PrivateChatMessagingManager(
         return f"private-chat:user-{user_id}"
 
     async def accept(self) -> None:
-        if await self.user_repository.find_by_id(self.user_id) is None:
+        if (
+            user := await self.user_repository.find_by_id(self.user_id)
+        ) is None:
             raise AuthUserNotFoundWebSocketException
 
-        if await self.user_repository.find_by_id(self.user_id) is None:
+        if await self.user_repository.find_by_id(self.target_id) is None:
             raise TargetUserNotFoundWebSocketException
 
+        self.user_payload = UserRead.from_orm(user).dict()
+
         self.chat, _ = await self.chat_service.get_or_create_private_chat(
             self.user_id, self.target_id
         )
@@ -95,13 +105,11 @@ class PrivateChatMessagingManager(
                         self.chat.id, self.user_id, body["message"]
                     )
 
-                body["from"] = UserRead.from_orm(
-                    await self.user_repository.find_by_id(self.user_id)
-                ).dict()
+                body["from"] = self.user_payload
                 # TODO: send notification
                 await self.broadcaster.publish(
                     channel=self._get_channel_for_user(self.target_id),
-                    message=json.dumps(body),
+                    message=_json_encoder.encode(body),
                 )
         except WebSocketDisconnect:
             ...
@@ -116,7 +124,7 @@ class PrivateChatMessagingManager(
 
                     match body.get("type"):
                         case "message":
-                            await self.websocket.send_json(body)
+                            await self.websocket.send_text(event.message)
         except WebSocketDisconnect:
             ...
 
@@ -145,6 +153,8 @@ class PublicChatMessagingManager(
     user_repository: UserRepository
     user_id: int
     chat_id: int
+    # Sender info attached to every message, resolved once on accept.
+    user_payload: dict[str, Any] = field(init=False, default_factory=dict)
 
     def _get_current_chat_channel(self) -> str:
         """Returns set chat channel name."""
@@ -158,6 +168,12 @@ class PublicChatMessagingManager(
         ):
             raise WebSocketChatDoesNotExist
 
+        if (
+            user := await self.user_repository.find_by_id(self.user_id)
+        ) is None:
+            raise AuthUserNotFoundWebSocketException
+
+        self.user_payload = UserRead.from_orm(user).dict()
         await self.websocket.accept()
 
     async def receiver(self) -> None:
@@ -171,14 +187,12 @@ class PublicChatMessagingManager(
                 self.chat_id, self.user_id, body["message"]
             )
 
-            body["from"] = UserRead.from_orm(
-                await self.user_repository.find_by_id(self.user_id)
-            ).dict()
+            body["from"] = self.user_payload
             # TODO: send notifications
 
             await self.broadcaster.publish(
                 channel=self._get_current_chat_channel(),
-                message=json.dumps(body),
+                message=_json_encoder.encode(body),
             )
 
     async def sender(self) -> None:
@@ -191,7 +205,7 @@ class PublicChatMessagingManager(
                 match body.get("type"):
                     case "message":
                         if body["from"]["id"] != self.user_id:
-                            await self.websocket.send_json(body)
+                            await self.websocket.send_text(event.message)
 
     async def run(self) -> None:
         """Concurrently runs receiver and producer."""
@@ -24,6 +24,13 @@ if bool(os.getenv("READ_ENV_FROM_FILE")) is True:
 JWT_ACCESS_TOKEN_EXPIRE: Seconds = 60 * 30  # 30 minutes
 JWT_REFRESH_TOKEN_EXPIRE: Seconds = 60 * 60 * 24 * 7  # 7 days
 JWT_ALGORITHM = "HS256"
+JWT_DECODE_CACHE_SIZE = 50_000
+JWT_DECODE_CACHE_TTL: Seconds = 60
+JWT_MAX_LENGTH = 8192
+
+# Passwords
+PASSWORD_VERIFY_CACHE_SIZE = 10_000
+PASSWORD_VERIFY_CACHE_TTL: Seconds = 60
 
 # staticfiles
 STATIC_DOMAIN = "http://localhost:8000"
@@ -32,9 +39,16 @@ STATIC_ROOT = BASE_DIR / "media"
 
 # Pagination
 PAGE_SIZE_DEFAULT = 10
+PAGE_SIZE_MAX = 100
+
+# Cache
+CACHE_VERSION_CACHE_SIZE = 1024
+CACHE_VERSION_TTL: Seconds = 1
 
 # Chat
 CHAT_INVITE_LINK_DURATION: Seconds = 60 * 60 * 24  # 24 hours
+PUBLIC_CHATS_CACHE_NAMESPACE = "public-chats"
+PUBLIC_CHATS_CACHE_TTL: Seconds = 60
 
 
 class Settings(BaseSettings):
@@ -48,5 +62,12 @@ class Settings(BaseSettings):
     database_url: str
     messaging_url: str
 
+    bcrypt_rounds: int = 12
+
+    db_pool_size: int = 25
+    db_max_overflow: int = 25
+    db_pool_recycle: Seconds = 60 * 30  # 30 minutes
+    db_query_cache_size: int = 1200
+
 
 settings = Settings()
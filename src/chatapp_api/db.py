@@ -1,28 +1,38 @@
 """
 DB module with database configs and declarations.
 """
-from typing import cast
-
 from aioredis import Redis
 from aioredis.exceptions import ConnectionError as RedisConnectionError
 from asyncpg import connect
-from sqlalchemy import Engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import Session, sessionmaker
+from broadcaster import Broadcast  # type: ignore
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from src.chatapp_api import utils
 from src.chatapp_api.config import settings
 
 # PostgreSQL
-engine = create_async_engine(settings.database_url)
-async_session = sessionmaker(
-    cast(Engine, engine),
-    class_=cast(Session, AsyncSession),
+engine = create_async_engine(
+    settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    query_cache_size=settings.db_query_cache_size,
+)
+async_session = async_sessionmaker(
+    engine,
     autoflush=False,
     expire_on_commit=False,
     autocommit=False,
 )
 
+# Redis, connections are opened lazily from client's pool.
+redis = Redis.from_url(settings.messaging_url)
+# Pub/sub shared by all websockets of process. Holds single redis
+# subscription per channel and fans messages out to local subscribers.
+# Connected and disconnected with app's lifetime.
+broadcast = Broadcast(settings.messaging_url)
+
 
 async def ping_sql_database():
     """Pings SQL DB in order to make sure it is running"""
@@ -1,29 +1,32 @@
 """Module with FastAPI dependencies."""
 from collections.abc import AsyncIterator
-from typing import cast
 
 from broadcaster import Broadcast  # type: ignore
 from fastapi import Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.chatapp_api.cache import BaseCacheManager, RedisCacheManager
 from src.chatapp_api.config import (
     PAGE_SIZE_DEFAULT,
+    PAGE_SIZE_MAX,
     STATIC_DOMAIN,
     STATIC_ROOT,
     STATIC_URL,
-    settings,
 )
-from src.chatapp_api.db import async_session
-from src.chatapp_api.paginator import LimitOffsetPaginator
+from src.chatapp_api.db import async_session, broadcast, redis
+from src.chatapp_api.paginator import KeysetPaginator, LimitOffsetPaginator
 from src.chatapp_api.staticfiles import (
     BaseStaticFilesManager,
     LocalStaticFilesManager,
 )
 
+# Shared by requests of process, keeping cached namespace versions.
+_cache_manager = RedisCacheManager(redis)
+
 
 async def get_db_session() -> AsyncIterator[AsyncSession]:
     """Returns db session for FastAPI dependency injection."""
-    db_session = cast(AsyncSession, async_session())
+    db_session = async_session()
     try:
         yield db_session
     finally:
@@ -35,19 +38,31 @@ def get_staticfiles_manager() -> BaseStaticFilesManager:
     return LocalStaticFilesManager(STATIC_DOMAIN, STATIC_URL, STATIC_ROOT)
 
 
-async def get_broadcaster() -> AsyncIterator[Broadcast]:
+def get_cache_manager() -> BaseCacheManager:
+    """Dependency for cache manager."""
+    return _cache_manager
+
+
+def get_broadcaster() -> Broadcast:
     """Dependency for broadcaster."""
-    broadcast = Broadcast(settings.messaging_url)
-    await broadcast.connect()
-    yield broadcast
-    await broadcast.disconnect()
+    return broadcast
 
 
 def get_paginator(
     request: Request,
-    page: int = Query(default=1),
-    page_size: int = Query(default=PAGE_SIZE_DEFAULT),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
     session: AsyncSession = Depends(get_db_session),
 ):
     """Returns pagination with page and page size query params."""
     return LimitOffsetPaginator(session, page, page_size, request)
+
+
+def get_keyset_paginator(
+    request: Request,
+    cursor: str | None = Query(default=None),
+    page_size: int = Query(default=PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Returns keyset pagination with cursor and page size query params."""
+    return KeysetPaginator(session, cursor, page_size, request)
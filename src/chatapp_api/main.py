@@ -6,7 +6,11 @@ from fastapi.staticfiles import StaticFiles
 from src.chatapp_api.auth.routes import router as auth_router
 from src.chatapp_api.chat.routes import router as chat_router
 from src.chatapp_api.config import STATIC_ROOT, STATIC_URL, settings
-from src.chatapp_api.db import ping_redis_database, ping_sql_database
+from src.chatapp_api.db import (
+    broadcast,
+    ping_redis_database,
+    ping_sql_database,
+)
 from src.chatapp_api.friendship.routes import router as friendship_router
 from src.chatapp_api.user.routes import router as user_router
 
@@ -23,7 +27,8 @@ app = FastAPI(
         "name": "Togrul Asadov",
         "github": "https://github.com/togrul2",
     },
-    on_startup=[ping_sql_database, ping_redis_database],
+    on_startup=[ping_sql_database, ping_redis_database, broadcast.connect],
+    on_shutdown=[broadcast.disconnect],
 )
 
 app.mount(
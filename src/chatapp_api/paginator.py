@@ -1,18 +1,23 @@
 """Module with custom paginator classes."""
+import base64
+import binascii
 import math
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Generic, TypeVar
 from urllib import parse
 
 from fastapi import Request
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql import CompoundSelect
 from sqlalchemy.sql.expression import Select
 
+from src.chatapp_api.base.exceptions import InvalidCursorException
 from src.chatapp_api.base.models import CustomBase
 
 T = TypeVar("T", bound=CustomBase | Row)
@@ -31,6 +36,16 @@ class Page(Generic[T]):
     prev_page: str | None
 
 
+@dataclass
+class CursorPage(Generic[T]):
+    """Dataclass for response body of keyset paginated GET endpoint."""
+
+    results: Sequence[T]
+    items_per_page: int
+    next_cursor: str | None
+    next_page: str | None
+
+
 @dataclass
 class BasePaginator(ABC):
     """Base class for paginator.
@@ -162,3 +177,85 @@ class LimitOffsetPaginator(BasePaginator):
         return query.offset((self.page - 1) * self.page_size).limit(
             self.page_size
         )
+
+
+@dataclass
+class KeysetPaginator:
+    """Keyset (cursor) implementation of pagination.
+    Seeks past (created_at, id) pair of the last row from previous page
+    instead of skipping rows with offset, so deep pages are as cheap
+    as the first one. Pages are ordered from newest to oldest."""
+
+    session: AsyncSession
+    cursor: str | None
+    page_size: int
+    request: Request
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, id: int) -> str:
+        """Encodes keyset of a row into opaque cursor string."""
+        return base64.urlsafe_b64encode(
+            f"{created_at.isoformat()},{id}".encode()
+        ).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        """Decodes cursor string into keyset of a row.
+        Raises 400 http error if cursor is malformed."""
+        try:
+            created_at, id = (
+                base64.urlsafe_b64decode(cursor).decode().rsplit(",", 1)
+            )
+            return datetime.fromisoformat(created_at), int(id)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise InvalidCursorException from exc
+
+    def _get_url_for_cursor(self, cursor: str | None) -> str | None:
+        """Generates url for page starting after given cursor."""
+        if cursor is None:
+            return None
+
+        return str(self.request.url.include_query_params(cursor=cursor))
+
+    async def get_page_for_model(
+        self,
+        query: Select[tuple[T]],
+        created_at_column: InstrumentedAttribute[datetime],
+        id_column: InstrumentedAttribute[int],
+    ) -> CursorPage[T]:
+        """
+        Returns page of orm models from query ordered by
+        given created at and id columns in descending order.
+
+        Example:
+            >>> from src.chat.models import Message
+            >>> response = self.get_page_for_model(
+            >>>     select(Message), Message.created_at, Message.id)
+        """
+        if self.cursor is not None:
+            query = query.where(
+                tuple_(created_at_column, id_column)
+                < tuple_(*self.decode_cursor(self.cursor))
+            )
+
+        # One extra row tells whether there is a next page.
+        query = query.order_by(
+            created_at_column.desc(), id_column.desc()
+        ).limit(self.page_size + 1)
+        results = (await self.session.scalars(query)).all()
+        next_cursor = None
+
+        if len(results) > self.page_size:
+            results = results[: self.page_size]
+            last = results[-1]
+            next_cursor = self.encode_cursor(
+                getattr(last, created_at_column.key),
+                getattr(last, id_column.key),
+            )
+
+        return CursorPage(
+            results=results,
+            items_per_page=self.page_size,
+            next_cursor=next_cursor,
+            next_page=self._get_url_for_cursor(next_cursor),
+        )
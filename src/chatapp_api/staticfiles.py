@@ -2,12 +2,24 @@
 import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from urllib import parse
 
 from fastapi import UploadFile
 
 
+@lru_cache(maxsize=4096)
+def ensure_directory(path: Path) -> Path:
+    """
+    Creates directory with its parents if they do not exist.
+    Result is cached, so subsequent calls for the same path skip syscalls.
+    Cache must be cleared if cached directory might have been removed.
+    """
+    path.mkdir(exist_ok=True, parents=True)
+    return path
+
+
 class BaseStaticFilesManager(ABC):
     """
     Base class for staticfiles managers.
@@ -42,9 +54,15 @@ class LocalStaticFilesManager(BaseStaticFilesManager):
         return f"{self.static_url}/{path}"
 
     def load(self, path: str, file: UploadFile) -> None:
-        full_path = self.static_root / path
-        full_path.mkdir(exist_ok=True, parents=True)
-        file_path = full_path / file.filename
+        full_path = ensure_directory(self.static_root / path)
+
+        try:
+            temp_file = open(full_path / file.filename, "wb")
+        except FileNotFoundError:
+            # Cached directory has been removed since, so it is recreated.
+            ensure_directory.cache_clear()
+            full_path = ensure_directory(self.static_root / path)
+            temp_file = open(full_path / file.filename, "wb")
 
-        with open(file_path, "wb") as temp_file:
+        with temp_file:
             shutil.copyfileobj(file.file, temp_file)
@@ -2,7 +2,9 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.chatapp_api.cache import BaseCacheManager
 from src.chatapp_api.dependencies import (
+    get_cache_manager,
     get_db_session,
     get_paginator,
     get_staticfiles_manager,
@@ -26,6 +28,7 @@ def get_user_service(
     staticfiles_manager: BaseStaticFilesManager = Depends(
         get_staticfiles_manager
     ),
+    cache_manager: BaseCacheManager = Depends(get_cache_manager),
 ):
     """Dependency injector for user service"""
-    return UserService(user_repository, staticfiles_manager)
+    return UserService(user_repository, staticfiles_manager, cache_manager)
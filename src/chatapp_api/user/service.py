@@ -1,6 +1,7 @@
 """User service module."""
 import os
 import uuid
+from contextlib import suppress
 from dataclasses import dataclass
 from urllib import parse
 
@@ -8,8 +9,10 @@ from fastapi import UploadFile
 
 from src.chatapp_api import utils
 from src.chatapp_api.auth.exceptions import BadTokenException
-from src.chatapp_api.auth.jwt import password_context
+from src.chatapp_api.auth.jwt import hash_password, verify_password
 from src.chatapp_api.base.exceptions import NotFoundException
+from src.chatapp_api.cache import CACHE_UNAVAILABLE_ERRORS, BaseCacheManager
+from src.chatapp_api.config import PUBLIC_CHATS_CACHE_NAMESPACE
 from src.chatapp_api.paginator import Page
 from src.chatapp_api.staticfiles import BaseStaticFilesManager
 from src.chatapp_api.user.exceptions import (
@@ -29,6 +32,7 @@ class UserService:
 
     user_repository: UserRepository
     staticfiles_manager: BaseStaticFilesManager
+    cache_manager: BaseCacheManager
 
     @staticmethod
     def get_profile_pictures_dir(user_id: int) -> str:
@@ -106,7 +110,7 @@ class UserService:
             email=email,
             first_name=first_name,
             last_name=last_name,
-            password=password_context.hash(password),
+            password=await hash_password(password),
         )
         self.user_repository.add(user)
         await self.user_repository.commit()
@@ -212,18 +216,29 @@ class UserService:
         """Updates user's password. If old one is incorrect raises 400 error"""
         user = await self.get_or_401(user_id)
 
-        if not password_context.verify(old_password, user.password):
+        if not await verify_password(old_password, user.password):
             raise InvalidOldPassword
 
-        user.password = password_context.hash(new_password)
+        user.password = await hash_password(new_password)
         self.user_repository.add(user)
         await self.user_repository.commit()
         self.set_user_full_profile_picture_url(user)
         return user
 
+    async def rehash_password(self, user: User, password: str) -> None:
+        """Rehashes user's password with currently configured rounds.
+        Given password must be already verified."""
+        user.password = await hash_password(password)
+        self.user_repository.add(user)
+        await self.user_repository.commit()
+
     async def delete_user(self, user_id: int) -> None:
         """Deletes user with given id.
         If user is not found, raises 401 not authenticated."""
         user = await self.get_or_401(user_id)
         await self.user_repository.delete(user)
         await self.user_repository.commit()
+        # Memberships of user are deleted with it, changing users count
+        # of cached public chats.
+        with suppress(*CACHE_UNAVAILABLE_ERRORS):
+            await self.cache_manager.invalidate(PUBLIC_CHATS_CACHE_NAMESPACE)
@@ -1,9 +1,15 @@
 """Miscellaneous utils for project."""
 import re
-from collections.abc import Sequence
-from typing import TypedDict
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Generic, TypedDict, TypeVar
 from urllib import parse
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
 
 def split_path(path: str) -> Sequence[str]:
     """Splits path by `/` or `\\`. Basically universal
@@ -89,3 +95,60 @@ def parse_message_broker_url(url: str) -> ParsedMessageBrokerUrl:
         raise ValueError("Invalid db number, must be numeric")
 
     return {"hostname": hostname, "port": port, "db": int(db)}
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread safe in-memory LRU cache whose entries expire after ttl seconds.
+    Least recently used entries are evicted once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Returns value for key if it is present and not expired."""
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is None:
+                return default
+
+            value, expires_at = item
+
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Stores value for key. Custom ttl may be given per entry."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Removes key from cache if it is present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries from cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -8,13 +8,23 @@ import shutil
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient, Headers
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
-from src.chatapp_api.auth.jwt import create_access_token, password_context
+from src.chatapp_api.auth.jwt import create_access_token, hash_password
+from src.chatapp_api.cache import LocalCacheManager
 from src.chatapp_api.chat.models import Chat
-from src.chatapp_api.config import BASE_DIR, settings
+from src.chatapp_api.config import (
+    BASE_DIR,
+    PUBLIC_CHATS_CACHE_NAMESPACE,
+    settings,
+)
 from src.chatapp_api.dependencies import (
+    get_cache_manager,
     get_db_session,
     get_staticfiles_manager,
 )
@@ -48,10 +58,10 @@ dbms_session: DBSQLAsyncManager = PostgreSQLAsyncManager(
 )
 
 
-test_engine = create_async_engine(url=test_db_url)
-async_session = sessionmaker(
+# Connections are not pooled, so none outlives event loop it was made in.
+test_engine = create_async_engine(url=test_db_url, poolclass=NullPool)
+async_session = async_sessionmaker(
     bind=test_engine,
-    class_=AsyncSession,
     autoflush=False,
     expire_on_commit=False,
 )
@@ -89,7 +99,20 @@ async def session():
 
 
 @pytest.fixture(scope="session")
-async def test_app(session: AsyncSession):
+def cache_manager():
+    """Cache manager shared by all requests of test app."""
+    yield LocalCacheManager()
+
+
+@pytest.fixture(autouse=True)
+async def clear_cache(cache_manager: LocalCacheManager):
+    """Invalidates cached responses before every test,
+    as fixtures write to db directly."""
+    await cache_manager.invalidate(PUBLIC_CHATS_CACHE_NAMESPACE)
+
+
+@pytest.fixture(scope="session")
+async def test_app(session: AsyncSession, cache_manager: LocalCacheManager):
     """Test FastAPI app for processing requests.
     Uses testing database and staticfiles manager."""
 
@@ -103,7 +126,14 @@ async def test_app(session: AsyncSession):
             "http://localhost:8000", "/static/", TEST_STATIC_ROOT
         )
 
+    def _get_test_cache_manager():
+        """Testing dependency for cache manager."""
+        return cache_manager
+
     fastapi_app.dependency_overrides[get_db_session] = _get_test_db
+    fastapi_app.dependency_overrides[
+        get_cache_manager
+    ] = _get_test_cache_manager
     fastapi_app.dependency_overrides[
         get_staticfiles_manager
     ] = _get_test_staticfiles_manager
@@ -128,7 +158,7 @@ async def auth_client(user: User, client: AsyncClient):
 @pytest.fixture()
 async def user(session: AsyncSession):
     """Fixture for generating user"""
-    password = password_context.hash("Testpassword")
+    password = await hash_password("Testpassword")
     user_model = User(
         username="johndoe",
         email="johndoe@example.com",
@@ -146,7 +176,7 @@ async def user(session: AsyncSession):
 @pytest.fixture()
 async def sender_user(session: AsyncSession):
     """User for sending friendship request to another one."""
-    password = password_context.hash("Testpassword")
+    password = await hash_password("Testpassword")
     user_model = User(
         username="peterdoe",
         email="peterdoe@example.com",
@@ -4,6 +4,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 
 from asyncpg import Connection, connect
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.chatapp_api.base.models import CustomBase
@@ -93,6 +94,7 @@ class PostgreSQLAsyncManager(DBSQLAsyncManager):
 async def create_tables(test_engine: AsyncEngine) -> None:
     """Creates all the tables in the binded to the engine database."""
     async with test_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(CustomBase.metadata.create_all)
 
 
@@ -67,3 +67,32 @@ class TestToken:
         assert (
             response.status_code == status.HTTP_401_UNAUTHORIZED
         ), AssertionErrors.HTTP_NOT_401_UNAUTHENTICATED
+
+
+@pytest.mark.asyncio
+class TestValidate:
+    """Test access token validation endpoint."""
+
+    url = "/api/validate"
+
+    async def test_validate_success(self, auth_client: AsyncClient):
+        """Test validating valid access token."""
+        response = await auth_client.post(self.url)
+
+        assert (
+            response.status_code == status.HTTP_204_NO_CONTENT
+        ), AssertionErrors.HTTP_NOT_204_NO_CONTENT
+        assert response.content == b""
+
+    async def test_validate_refresh_token(
+        self, client: AsyncClient, user: User
+    ):
+        """Test validating refresh token passed as access token."""
+        refresh_token = create_refresh_token(user.id)
+        response = await client.post(
+            self.url, headers={"Authorization": f"Bearer {refresh_token}"}
+        )
+
+        assert (
+            response.status_code == status.HTTP_401_UNAUTHORIZED
+        ), AssertionErrors.HTTP_NOT_401_UNAUTHENTICATED
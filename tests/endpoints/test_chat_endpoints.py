@@ -5,14 +5,18 @@ from typing import Any
 import pytest
 from fastapi import status
 from httpx import AsyncClient
-from sqlalchemy import exists, select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.chatapp_api.base.schemas import PaginatedResponse
+from src.chatapp_api.base.schemas import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+)
 from src.chatapp_api.chat.models import Chat, Membership, Message
 from src.chatapp_api.chat.schemas import (
     ChatRead,
     ChatReadWithUsersCount,
+    MembershipRead,
     MessageRead,
 )
 from src.chatapp_api.friendship.models import Friendship
@@ -84,9 +88,58 @@ class TestPrivateChatApi:
             response.status_code == status.HTTP_200_OK
         ), AssertionErrors.HTTP_NOT_200_OK
         assert validate_dict(
-            PaginatedResponse[MessageRead], body
+            CursorPaginatedResponse[MessageRead], body
         ), AssertionErrors.INVALID_BODY
         assert len(body["results"]) == 3, AssertionErrors.INVALID_NUM_OF_ROWS
+        assert body["next_cursor"] is None
+
+    @pytest.mark.usefixtures("private_chat_with_messages")
+    async def test_get_private_chat_messages_with_cursor(
+        self, auth_client: AsyncClient, sender_user: User
+    ):
+        """Tests listing messages page by page with cursor."""
+        url = self.url.format(user_id=sender_user.id)
+        response = await auth_client.get(url, params={"page_size": 2})
+        first_page = response.json()
+
+        assert (
+            response.status_code == status.HTTP_200_OK
+        ), AssertionErrors.HTTP_NOT_200_OK
+        assert (
+            len(first_page["results"]) == 2
+        ), AssertionErrors.INVALID_NUM_OF_ROWS
+        assert first_page["next_cursor"] is not None
+
+        response = await auth_client.get(
+            url, params={"page_size": 2, "cursor": first_page["next_cursor"]}
+        )
+        second_page = response.json()
+
+        assert (
+            response.status_code == status.HTTP_200_OK
+        ), AssertionErrors.HTTP_NOT_200_OK
+        assert (
+            len(second_page["results"]) == 1
+        ), AssertionErrors.INVALID_NUM_OF_ROWS
+        assert second_page["next_cursor"] is None
+        assert [
+            message["body"]
+            for message in first_page["results"] + second_page["results"]
+        ] == ["How are you?", "Hi", "Hello"]
+
+    @pytest.mark.usefixtures("private_chat_with_messages")
+    async def test_get_private_chat_messages_with_invalid_cursor(
+        self, auth_client: AsyncClient, sender_user: User
+    ):
+        """Tests listing messages with malformed cursor."""
+        response = await auth_client.get(
+            self.url.format(user_id=sender_user.id),
+            params={"cursor": "invalid"},
+        )
+
+        assert (
+            response.status_code == status.HTTP_400_BAD_REQUEST
+        ), AssertionErrors.HTTP_NOT_400_BAD_REQUEST
 
     async def test_get_private_chat_messages_from_unexisting_user(
         self, auth_client: AsyncClient
@@ -138,6 +191,16 @@ class TestPublicChatApi:
         ), AssertionErrors.INVALID_BODY
         assert len(body["results"]) == 4, AssertionErrors.INVALID_NUM_OF_ROWS
 
+    async def test_list_public_chats_with_too_large_page_size(
+        self, client: AsyncClient
+    ):
+        """Test listing public chats with page size above the limit."""
+        response = await client.get(self.url, params={"page_size": 101})
+
+        assert (
+            response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        ), AssertionErrors.HTTP_NOT_422_UNPROCESSABLE_ENTITY
+
     @pytest.mark.usefixtures("public_chats")
     async def test_search_public_chats(self, client: AsyncClient):
         """Test searching for public chats by keyword."""
@@ -198,6 +261,36 @@ class TestPublicChatApi:
             is True
         ), "Passed user is not its member"
 
+    async def test_create_public_chat_with_repeated_members(
+        self,
+        session: AsyncSession,
+        auth_client: AsyncClient,
+        user: User,
+        sender_user: User,
+    ):
+        """Tests creating a public chat with members listed twice
+        and creator listed among them."""
+        payload = {
+            "name": "Bikes.com",
+            "members": [
+                {"id": sender_user.id, "is_admin": False},
+                {"id": sender_user.id, "is_admin": False},
+                {"id": user.id, "is_admin": False},
+            ],
+        }
+        response = await auth_client.post(self.url, json=payload)
+        assert (
+            response.status_code == status.HTTP_201_CREATED
+        ), AssertionErrors.HTTP_NOT_201_CREATED
+
+        chat_id = response.json()["id"]
+        members_count = await session.scalar(
+            select(func.count(Membership.id)).where(
+                Membership.chat_id == chat_id
+            )
+        )
+        assert members_count == 2, AssertionErrors.INVALID_NUM_OF_ROWS
+
     async def test_create_public_chat_with_taken_name(
         self,
         auth_client: AsyncClient,
@@ -266,6 +359,41 @@ class TestPublicChatDetailsApi:
         assert validate_dict(ChatRead, body) is True
         assert body["name"] == payload["name"]
 
+    async def test_update_public_chat_invalidates_cache(
+        self,
+        session: AsyncSession,
+        user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test that public chat is not served from cache after update."""
+        url = self.url.format(chat_id=public_chat.id)
+        response = await auth_client.get(url)
+        assert response.json()["name"] == public_chat.name
+        session.add(
+            Membership(
+                user_id=user.id,
+                chat_id=public_chat.id,
+                is_admin=True,
+                is_owner=True,
+                accepted=True,
+            )
+        )
+        await session.commit()
+        payload = {"name": "new-chat-name"}
+        response = await auth_client.put(url, json=payload)
+        assert (
+            response.status_code == status.HTTP_200_OK
+        ), AssertionErrors.HTTP_NOT_200_OK
+
+        response = await auth_client.get(url)
+        assert (
+            response.status_code == status.HTTP_200_OK
+        ), AssertionErrors.HTTP_NOT_200_OK
+        body = response.json()
+        assert body["name"] == payload["name"], "Stale chat is served"
+        assert body["users_count"] == 1, "Stale chat is served"
+
     async def test_update_nonexistent_public_chat(
         self, auth_client: AsyncClient
     ):
@@ -334,3 +462,206 @@ class TestPublicChatDetailsApi:
         assert (
             response.status_code == status.HTTP_403_FORBIDDEN
         ), AssertionErrors.HTTP_NOT_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+class TestChatMembersApi:
+    """Class with tests for chat member endpoints."""
+
+    url = "/api/chats/{chat_id}/members/{target_id}"
+    list_url = "/api/chats/{chat_id}/members"
+
+    @staticmethod
+    async def _add_members(
+        session: AsyncSession, chat: Chat, *members: tuple[User, bool]
+    ):
+        """Adds given users with their admin flag to chat."""
+        session.add_all(
+            Membership(
+                chat_id=chat.id,
+                user_id=member.id,
+                is_admin=is_admin,
+                is_owner=False,
+                accepted=True,
+            )
+            for member, is_admin in members
+        )
+        await session.commit()
+
+    async def test_list_chat_members(
+        self,
+        session: AsyncSession,
+        user: User,
+        sender_user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test listing members of chat by its member."""
+        await self._add_members(
+            session, public_chat, (user, True), (sender_user, False)
+        )
+        response = await auth_client.get(
+            self.list_url.format(chat_id=public_chat.id)
+        )
+
+        assert (
+            response.status_code == status.HTTP_200_OK
+        ), AssertionErrors.HTTP_NOT_200_OK
+        body = response.json()
+        assert validate_dict(
+            PaginatedResponse[MembershipRead], body
+        ), AssertionErrors.INVALID_BODY
+        assert {member["user"]["id"] for member in body["results"]} == {
+            user.id,
+            sender_user.id,
+        }, "Listed members do not match chat members"
+
+    async def test_demote_chat_admin(
+        self,
+        session: AsyncSession,
+        user: User,
+        sender_user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test demoting other admin by a chat admin."""
+        await self._add_members(
+            session, public_chat, (user, True), (sender_user, True)
+        )
+        response = await auth_client.patch(
+            self.url.format(chat_id=public_chat.id, target_id=sender_user.id),
+            json={"is_admin": False},
+        )
+
+        assert (
+            response.status_code == status.HTTP_200_OK
+        ), AssertionErrors.HTTP_NOT_200_OK
+        body = response.json()
+        assert validate_dict(MembershipRead, body) is True
+        assert body["is_admin"] is False, "Admin has not been demoted"
+
+    async def test_demote_self(
+        self,
+        session: AsyncSession,
+        user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test admin demoting themselves, after which
+        they can not promote anyone, themselves included."""
+        await self._add_members(session, public_chat, (user, True))
+        url = self.url.format(chat_id=public_chat.id, target_id=user.id)
+        response = await auth_client.patch(url, json={"is_admin": False})
+
+        assert (
+            response.status_code == status.HTTP_200_OK
+        ), AssertionErrors.HTTP_NOT_200_OK
+        assert response.json()["is_admin"] is False, "Admin is not demoted"
+
+        response = await auth_client.patch(url, json={"is_admin": True})
+        assert (
+            response.status_code == status.HTTP_403_FORBIDDEN
+        ), AssertionErrors.HTTP_NOT_403_FORBIDDEN
+
+    async def test_demote_chat_owner(
+        self,
+        session: AsyncSession,
+        user: User,
+        sender_user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test that chat admin can not demote chat owner."""
+        await self._add_members(session, public_chat, (user, True))
+        session.add(
+            Membership(
+                chat_id=public_chat.id,
+                user_id=sender_user.id,
+                is_admin=True,
+                is_owner=True,
+                accepted=True,
+            )
+        )
+        await session.commit()
+        response = await auth_client.patch(
+            self.url.format(chat_id=public_chat.id, target_id=sender_user.id),
+            json={"is_admin": False},
+        )
+
+        assert (
+            response.status_code == status.HTTP_403_FORBIDDEN
+        ), AssertionErrors.HTTP_NOT_403_FORBIDDEN
+        assert (
+            await session.scalar(
+                select(Membership.is_admin)
+                .where(Membership.chat_id == public_chat.id)
+                .where(Membership.user_id == sender_user.id)
+            )
+            is True
+        ), "Owner has been demoted"
+
+    async def test_remove_chat_member_by_non_admin(
+        self,
+        session: AsyncSession,
+        user: User,
+        sender_user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test removing other member by a member who is not an admin."""
+        await self._add_members(
+            session, public_chat, (user, False), (sender_user, False)
+        )
+        response = await auth_client.delete(
+            self.url.format(chat_id=public_chat.id, target_id=sender_user.id)
+        )
+
+        assert (
+            response.status_code == status.HTTP_403_FORBIDDEN
+        ), AssertionErrors.HTTP_NOT_403_FORBIDDEN
+        assert (
+            await session.scalar(
+                exists()
+                .where(Membership.chat_id == public_chat.id)
+                .where(Membership.user_id == sender_user.id)
+                .select()
+            )
+            is True
+        ), "Member has been removed by non admin"
+
+    async def test_remove_chat_member_by_admin(
+        self,
+        session: AsyncSession,
+        user: User,
+        sender_user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test removing other member by a chat admin."""
+        await self._add_members(
+            session, public_chat, (user, True), (sender_user, False)
+        )
+        response = await auth_client.delete(
+            self.url.format(chat_id=public_chat.id, target_id=sender_user.id)
+        )
+
+        assert (
+            response.status_code == status.HTTP_204_NO_CONTENT
+        ), AssertionErrors.HTTP_NOT_204_NO_CONTENT
+
+    async def test_leave_chat(
+        self,
+        session: AsyncSession,
+        user: User,
+        auth_client: AsyncClient,
+        public_chat: Chat,
+    ):
+        """Test member removing themselves from chat."""
+        await self._add_members(session, public_chat, (user, False))
+        response = await auth_client.delete(
+            self.url.format(chat_id=public_chat.id, target_id=user.id)
+        )
+
+        assert (
+            response.status_code == status.HTTP_204_NO_CONTENT
+        ), AssertionErrors.HTTP_NOT_204_NO_CONTENT
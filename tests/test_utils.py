@@ -1,7 +1,11 @@
 """Module for testing functions from utils.py"""
+import time
+
 import pytest
+from jose import ExpiredSignatureError, JWTError
 
 from src.chatapp_api import utils
+from src.chatapp_api.auth import jwt
 
 
 @pytest.mark.parametrize(
@@ -67,3 +71,139 @@ def test_split_filename(filename, expected):
 def test_parse_url(url, expected):
     """Tests parse url function from utils module."""
     assert utils.parse_rdb_url(url) == expected
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Tests that ttl cache drops least recently used key when full."""
+    cache: utils.TTLCache[str, int] = utils.TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """Tests that ttl cache entries expire after their ttl."""
+    now = time.monotonic()
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now)
+    cache: utils.TTLCache[str, int] = utils.TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now + 10)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def _make_jwt(header: dict, payload: dict) -> str:
+    """Builds jwt with given header, signed with app secret key."""
+    signing_input = (
+        jwt._b64encode(jwt._json_encoder.encode(header).encode())
+        + b"."
+        + jwt._b64encode(jwt._json_encoder.encode(payload).encode())
+    )
+    signature = jwt._b64encode(jwt._sign(signing_input))
+    return (signing_input + b"." + signature).decode()
+
+
+def _replace_signature(token: str, signature: str) -> str:
+    """Returns token with its signature segment replaced."""
+    return token.rpartition(".")[0] + "." + signature
+
+
+def _make_non_canonical(segment: str) -> str:
+    """Flips unused trailing bit of base64url segment,
+    so it decodes to the same bytes."""
+    alphabet = (
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    )
+    return segment[:-1] + alphabet[alphabet.index(segment[-1]) ^ 1]
+
+
+def test_decode_jwt():
+    """Tests that decode jwt returns claims of valid token."""
+    payload = {"user_id": 1, "exp": int(time.time()) + 60}
+    assert jwt.decode_jwt(jwt.encode_jwt(payload)) == payload
+
+
+def test_decode_jwt_with_other_header():
+    """Tests that decode jwt accepts other headers with HS256 alg."""
+    payload = {"user_id": 1, "exp": int(time.time()) + 60}
+    token = _make_jwt({"typ": "JWT", "alg": "HS256"}, payload)
+    assert jwt.decode_jwt(token) == payload
+
+
+def test_decode_jwt_expired():
+    """Tests that decode jwt rejects expired token."""
+    token = jwt.encode_jwt({"user_id": 1, "exp": int(time.time()) - 1})
+
+    with pytest.raises(ExpiredSignatureError):
+        jwt.decode_jwt(token)
+
+
+_valid_token = jwt.encode_jwt({"user_id": 1, "exp": int(time.time()) + 600})
+_valid_signature = _valid_token.rpartition(".")[2]
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        # Tampered signature.
+        _replace_signature(_valid_token, _valid_signature[::-1]),
+        # Algorithm other than HS256.
+        _make_jwt(
+            {"alg": "HS512", "typ": "JWT"},
+            {"user_id": 1, "exp": int(time.time()) + 600},
+        ),
+        # Unsigned token.
+        _replace_signature(
+            _make_jwt(
+                {"alg": "none", "typ": "JWT"},
+                {"user_id": 1, "exp": int(time.time()) + 600},
+            ),
+            "",
+        ),
+        # Missing exp claim.
+        _make_jwt({"alg": "HS256", "typ": "JWT"}, {"user_id": 1}),
+        # Non-numeric exp claim.
+        _make_jwt(
+            {"alg": "HS256", "typ": "JWT"}, {"user_id": 1, "exp": "never"}
+        ),
+        # Wrong segment count.
+        _valid_token.rpartition(".")[0],
+        _valid_token + ".",
+        # Padded signature.
+        _valid_token + "=",
+        # Signature with characters outside of base64url alphabet.
+        _replace_signature(_valid_token, _valid_signature[:-1] + "+"),
+        # Non-canonical signature.
+        _replace_signature(
+            _valid_token, _make_non_canonical(_valid_signature)
+        ),
+        "",
+        "not a jwt",
+    ],
+)
+def test_decode_jwt_rejects_invalid_token(token):
+    """Tests that decode jwt rejects malformed, forged or unsigned tokens."""
+    with pytest.raises(JWTError):
+        jwt.decode_jwt(token)
+
+
+@pytest.mark.parametrize(
+    "hashed_password, expected",
+    [
+        (f"$2b${jwt.settings.bcrypt_rounds:02}$" + "a" * 53, False),
+        (f"$2b${jwt.settings.bcrypt_rounds + 1:02}$" + "a" * 53, True),
+        ("pbkdf2_sha256$260000$salt$digest", True),
+        ("$2b$", True),
+        ("", True),
+    ],
+)
+def test_password_needs_rehash(hashed_password, expected):
+    """Tests that other rounds and non bcrypt hashes need rehash."""
+    assert jwt.password_needs_rehash(hashed_password) is expected
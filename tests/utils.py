@@ -20,12 +20,18 @@ class AssertionErrors(str, Enum):
     HTTP_NOT_204_NO_CONTENT = (
         "Response code is not http 204 success no content"
     )
+    HTTP_NOT_400_BAD_REQUEST = (
+        "Response code is not http 400 error bad request"
+    )
     HTTP_NOT_401_UNAUTHENTICATED = (
         "Response code is not http 401 error unauthenticated"
     )
     HTTP_NOT_403_FORBIDDEN = "Response code is not http 403 error forbidden"
     HTTP_NOT_409_CONFLICT = "Response code is not http 409 error confict"
     HTTP_NOT_404_NOT_FOUND = "Response code is not http 404 error not found"
+    HTTP_NOT_422_UNPROCESSABLE_ENTITY = (
+        "Response code is not http 422 error unprocessable entity"
+    )
 
     INVALID_BODY = "Invalid response body"
     INVALID_NUM_OF_ROWS = "Unexpected number of rows"